@@ -3,22 +3,26 @@
 Each handler is an async function following python-telegram-bot v21
 conventions: ``async def handler(update, context)``.
 
-Dependencies (farmctl_path, data_dir, etc.) are read from
-``context.bot_data`` which is populated during bot initialization.
+Startup configuration (farmctl_path, data_dir, etc.) is read from the
+BotConfig stored in ``context.bot_data["cfg"]`` during bot initialization;
+runtime state (agent_mode, paused) lives directly in ``context.bot_data``.
 This module does NOT import the bot module to avoid circular imports.
 """
 
 from __future__ import annotations
 
+import asyncio
 import functools
-import json
 import logging
 import os
+import re
 import subprocess
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
+import orjson
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -31,7 +35,12 @@ from src.action_executor import ActionExecutor
 from src.actuator_state import reconcile_actuator_state
 from src.claude_client import get_chat_response
 from src.config_loader import load_hardware_profile, load_plant_profile, save_plant_profile
-from src.logger import load_recent_decisions, load_recent_plant_log, log_plant_observations
+from src.logger import (
+    load_recent_decisions,
+    load_recent_plant_log,
+    log_plant_observations,
+    recent_records,
+)
 from src.plant_agent import (
     apply_hardware_update,
     append_knowledge_update,
@@ -44,6 +53,35 @@ from src.weather import fetch_weather
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Bot configuration
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Startup configuration shared by all handlers.
+
+    Built once in ``bot.telegram_bot.main()`` and stored in
+    ``bot_data["cfg"]``. Values that change at runtime (agent_mode,
+    paused) are kept in ``bot_data`` instead.
+    """
+
+    data_dir: Path
+    chat_ids: tuple[int, ...]
+    farmctl_path: str
+    anthropic_api_key: str = field(repr=False)
+    pause_file: Path = field(init=False)
+    allowed_chat_ids: frozenset[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "pause_file", self.data_dir / ".paused")
+        object.__setattr__(self, "allowed_chat_ids", frozenset(self.chat_ids))
+
+
+def _cfg(context: ContextTypes.DEFAULT_TYPE) -> BotConfig:
+    return context.bot_data["cfg"]
+
+
 # ---------------------------------------------------------------------------
 # Authorization decorator
 # ---------------------------------------------------------------------------
@@ -51,17 +89,16 @@ logger = logging.getLogger(__name__)
 def authorized_only(func: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
     """Decorator to restrict commands to authorized chat IDs.
 
-    The allowed IDs are read from ``context.bot_data["authorized_chat_ids"]``
-    (a list of string chat IDs). If the list is empty, all users are allowed
-    (useful for initial setup / development).
+    The allowed IDs come from ``BotConfig.allowed_chat_ids``. If it is
+    empty, all users are allowed (useful for initial setup / development).
     """
 
     @functools.wraps(func)
     async def wrapper(
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> Any:
-        allowed_ids = context.bot_data.get("authorized_chat_ids", [])
-        if allowed_ids and str(update.effective_chat.id) not in allowed_ids:
+        allowed_ids = _cfg(context).allowed_chat_ids
+        if allowed_ids and update.effective_chat.id not in allowed_ids:
             await update.message.reply_text("Unauthorized.")
             return
         return await func(update, context)
@@ -79,11 +116,11 @@ def _bot_data(context: ContextTypes.DEFAULT_TYPE, key: str) -> Any:
 
 
 def _farmctl_path(context: ContextTypes.DEFAULT_TYPE) -> str:
-    return _bot_data(context, "farmctl_path") or ""
+    return _cfg(context).farmctl_path
 
 
 def _data_dir(context: ContextTypes.DEFAULT_TYPE) -> Path:
-    return Path(_bot_data(context, "data_dir") or "data")
+    return _cfg(context).data_dir
 
 
 def _is_dry_run(context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -91,13 +128,68 @@ def _is_dry_run(context: ContextTypes.DEFAULT_TYPE) -> bool:
 
 
 def _pause_file(context: ContextTypes.DEFAULT_TYPE) -> Path:
-    return _data_dir(context) / ".paused"
+    return _cfg(context).pause_file
 
 
 def _decisions_path(context: ContextTypes.DEFAULT_TYPE) -> Path:
     return _data_dir(context) / "decisions.jsonl"
 
 
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Return ``os.stat(path)``, or None if the file does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _load_hardware_profile_or_empty() -> dict[str, Any]:
+    try:
+        return load_hardware_profile()
+    except FileNotFoundError:
+        return {}
+
+
+def _read_sensors_or_mock(farmctl_path: str) -> SensorData:
+    try:
+        return read_sensors(farmctl_path)
+    except (SensorReadError, Exception) as exc:
+        logger.warning("Sensor read failed in chat, using mock: %s", exc)
+        return read_sensors_mock()
+
+
+def _parse_int_arg(args: list[str] | None, default: int) -> int | None:
+    """Parse the first command argument as an int.
+
+    Returns *default* when there are no arguments and None when the
+    argument is not an integer. Digits are checked up front so bad input
+    doesn't go through int()'s exception path.
+    """
+    if not args:
+        return default
+    text = args[0].strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    if not digits.isdecimal():
+        return None
+    return int(text)
+
+
+def _parse_duration(
+    args: list[str] | None, default: int, lo: int, hi: int, usage: str
+) -> tuple[int, str | None]:
+    """Parse a duration argument in seconds and check it is within [lo, hi].
+
+    Returns:
+        ``(duration, None)`` on success, or ``(0, error_message)``.
+    """
+    duration = _parse_int_arg(args, default)
+    if duration is None:
+        return 0, usage
+    if not lo <= duration <= hi:
+        return 0, f"Duration must be between {lo} and {hi} seconds."
+    return duration, None
+
+
 TELEGRAM_MAX_LENGTH = 4096
 
 
@@ -111,27 +203,35 @@ def _split_text(text: str, max_length: int = TELEGRAM_MAX_LENGTH) -> list[str]:
         return [text]
 
     chunks: list[str] = []
-    current = ""
+    # Lines of the chunk being built and its joined length, so we only
+    # join at flush time instead of re-concatenating on every line.
+    buf: list[str] = []
+    size = 0
 
     for line in text.split("\n"):
-        candidate = (current + "\n" + line) if current else line
-        if len(candidate) <= max_length:
-            current = candidate
+        candidate_size = size + 1 + len(line) if size else len(line)
+        if candidate_size <= max_length:
+            if size:
+                buf.append(line)
+            else:
+                buf = [line]
+            size = candidate_size
         else:
             # Flush current chunk if it has content
-            if current:
-                chunks.append(current)
-                current = ""
+            if size:
+                chunks.append("\n".join(buf))
+            buf = []
+            size = 0
             # If the single line itself exceeds max_length, hard-split it
             if len(line) > max_length:
-                while line:
-                    chunks.append(line[:max_length])
-                    line = line[max_length:]
+                for start in range(0, len(line), max_length):
+                    chunks.append(line[start:start + max_length])
             else:
-                current = line
+                buf = [line]
+                size = len(line)
 
-    if current:
-        chunks.append(current)
+    if size:
+        chunks.append("\n".join(buf))
 
     return chunks
 
@@ -153,11 +253,11 @@ async def _send_long_message(message, text: str, **kwargs) -> None:
 def _format_sensor_data(data: SensorData) -> str:
     """Format sensor data with emoji for Telegram readability."""
     lines = [
-        f"Temp:  {data.temperature_c:.1f} C",
-        f"Humidity:  {data.humidity_pct:.1f}%",
-        f"CO2:  {data.co2_ppm} ppm",
-        f"Light:  {data.light_level}",
-        f"Soil moisture:  {data.soil_moisture_pct:.1f}%",
+        f"Temp:  {data.temperature_c:.1f} C\n"
+        f"Humidity:  {data.humidity_pct:.1f}%\n"
+        f"CO2:  {data.co2_ppm} ppm\n"
+        f"Light:  {data.light_level}\n"
+        f"Soil moisture:  {data.soil_moisture_pct:.1f}%"
     ]
     # Hardware state (when available from firmware)
     if data.water_tank_ok is not None:
@@ -180,20 +280,89 @@ def _format_sensor_data(data: SensorData) -> str:
 def _load_recent_decisions(
     decisions_path: Path, n: int = 5
 ) -> list[dict[str, Any]]:
-    """Load the last *n* decisions from the JSONL log."""
-    if not decisions_path.exists():
-        return []
-
-    entries: list[dict[str, Any]] = []
-    with open(decisions_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return entries[-n:]
+    """Load the last *n* decisions from the JSONL log.
+
+    Results are cached until the file's mtime or size changes.
+    """
+    return recent_records(decisions_path, n)
+
+
+# Knowledge previews keyed by path -> (mtime_ns, preview).
+_KNOWLEDGE_PREFIX_CACHE: dict[Path, tuple[int, str]] = {}
+_KNOWLEDGE_PREFIX_CACHE_MAX = 4
+
+
+def _read_prefix(path: Path, limit: int = 500) -> str | None:
+    """Return the first *limit* characters of *path*, or None if missing.
+
+    Only the bytes needed for the preview are read, and the result is
+    cached until the file's mtime changes. "..." is appended when the
+    file is longer than *limit*.
+    """
+    st = _stat_or_none(path)
+    if st is None:
+        return None
+    mtime_ns = st.st_mtime_ns
+
+    cached = _KNOWLEDGE_PREFIX_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # UTF-8 is at most 4 bytes per character
+    with path.open("rb") as f:
+        buf = f.read(4 * (limit + 1))
+    content = buf.decode("utf-8", errors="replace")
+    if len(content) > limit:
+        content = content[:limit] + "..."
+
+    if path not in _KNOWLEDGE_PREFIX_CACHE and len(_KNOWLEDGE_PREFIX_CACHE) >= _KNOWLEDGE_PREFIX_CACHE_MAX:
+        del _KNOWLEDGE_PREFIX_CACHE[next(iter(_KNOWLEDGE_PREFIX_CACHE))]
+    _KNOWLEDGE_PREFIX_CACHE[path] = (mtime_ns, content)
+    return content
+
+
+# ---------------------------------------------------------------------------
+# Static message bodies
+# ---------------------------------------------------------------------------
+
+_START_TEXT = (
+    "Welcome to Plant-Ops AI!\n\n"
+    "I monitor your plant and control watering, lighting, heating, "
+    "and circulation automatically using AI.\n\n"
+    "Quick commands:\n"
+    "/status  - Current sensor readings\n"
+    "/photo   - Take a plant photo\n"
+    "/water   - Manual watering\n"
+    "/light   - Light on/off\n"
+    "/heater  - Heater on/off\n"
+    "/profile - Plant profile & ideal conditions\n"
+    "/help    - Full command list\n"
+)
+
+_HELP_TEXT = (
+    "Plant-Ops AI Commands\n"
+    "========================\n\n"
+    "Monitoring:\n"
+    "  /status          - Current sensor readings\n"
+    "  /photo           - Take a plant photo\n"
+    "  /history [n]     - Last N decisions (default 5)\n"
+    "  /profile         - Plant profile + ideal conditions\n\n"
+    "Manual control:\n"
+    "  /water [sec]     - Water (default 5s, max 30s)\n"
+    "  /light on|off    - Light control\n"
+    "  /heater on|off   - Heater control\n"
+    "  /circulation [s] - Circulation fan (default 60s, max 3600s)\n\n"
+    "Configuration:\n"
+    "  /setplant <name> - Set plant species\n"
+    "  /mode dry-run|live - Switch execution mode\n\n"
+    "Automation:\n"
+    "  /pause           - Pause scheduled monitoring\n"
+    "  /resume          - Resume scheduled monitoring\n"
+    "  /restart         - Restart the bot service\n"
+)
+
+# Pre-split once at import; /help always sends the same chunks.
+_HELP_CHUNKS: tuple[str, ...] = tuple(_split_text(_HELP_TEXT))
 
 
 # ---------------------------------------------------------------------------
@@ -205,20 +374,7 @@ async def start_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /start - welcome message with overview."""
-    text = (
-        "Welcome to Plant-Ops AI!\n\n"
-        "I monitor your plant and control watering, lighting, heating, "
-        "and circulation automatically using AI.\n\n"
-        "Quick commands:\n"
-        "/status  - Current sensor readings\n"
-        "/photo   - Take a plant photo\n"
-        "/water   - Manual watering\n"
-        "/light   - Light on/off\n"
-        "/heater  - Heater on/off\n"
-        "/profile - Plant profile & ideal conditions\n"
-        "/help    - Full command list\n"
-    )
-    await update.message.reply_text(text, reply_markup=main_menu_keyboard())
+    await update.message.reply_text(_START_TEXT, reply_markup=main_menu_keyboard())
 
 
 @authorized_only
@@ -226,28 +382,8 @@ async def help_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /help - list all commands."""
-    text = (
-        "Plant-Ops AI Commands\n"
-        "========================\n\n"
-        "Monitoring:\n"
-        "  /status          - Current sensor readings\n"
-        "  /photo           - Take a plant photo\n"
-        "  /history [n]     - Last N decisions (default 5)\n"
-        "  /profile         - Plant profile + ideal conditions\n\n"
-        "Manual control:\n"
-        "  /water [sec]     - Water (default 5s, max 30s)\n"
-        "  /light on|off    - Light control\n"
-        "  /heater on|off   - Heater control\n"
-        "  /circulation [s] - Circulation fan (default 60s, max 3600s)\n\n"
-        "Configuration:\n"
-        "  /setplant <name> - Set plant species\n"
-        "  /mode dry-run|live - Switch execution mode\n\n"
-        "Automation:\n"
-        "  /pause           - Pause scheduled monitoring\n"
-        "  /resume          - Resume scheduled monitoring\n"
-        "  /restart         - Restart the bot service\n"
-    )
-    await _send_long_message(update.message, text)
+    for chunk in _HELP_CHUNKS:
+        await update.message.reply_text(chunk)
 
 
 @authorized_only
@@ -256,7 +392,7 @@ async def status_command(
 ) -> None:
     """Handle /status - read sensors and display current data."""
     try:
-        data = read_sensors(_farmctl_path(context))
+        data = await asyncio.to_thread(read_sensors, _farmctl_path(context))
         text = "Current Sensor Readings\n\n" + _format_sensor_data(data)
     except SensorReadError as exc:
         text = f"Failed to read sensors: {exc}"
@@ -272,24 +408,33 @@ async def photo_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /photo - take a photo and send it."""
+    dry_run = _is_dry_run(context)
     try:
-        executor = ActionExecutor(
-            _farmctl_path(context), dry_run=_is_dry_run(context)
-        )
+        executor = ActionExecutor(_farmctl_path(context), dry_run=dry_run)
         data_dir = str(_data_dir(context))
         photo_path = "/tmp/plant_photo.jpg"
-        result = executor.take_photo_with_light(
+        # Off the event loop: the camera and serial sequence can wait on
+        # the farmctl lock held by a scheduled check.
+        result = await asyncio.to_thread(
+            executor.take_photo_with_light,
             output_path=photo_path,
             data_dir=data_dir,
             photos_dir=os.path.join(data_dir, "photos"),
         )
 
-        if result and Path(result).exists():
+        photo_bytes = None
+        if result:
+            try:
+                photo_bytes = await asyncio.to_thread(Path(result).read_bytes)
+            except FileNotFoundError:
+                pass
+
+        if photo_bytes is not None:
             await update.message.reply_photo(
-                photo=open(result, "rb"),
+                photo=photo_bytes,
                 caption="Plant photo taken just now.",
             )
-        elif _is_dry_run(context):
+        elif dry_run:
             await update.message.reply_text(
                 "[Dry-run] Photo would be captured to: " + photo_path
             )
@@ -308,22 +453,11 @@ async def water_command(
 
     Default 5 seconds, max 30.
     """
-    args = context.args or []
-    duration = 5
-
-    if args:
-        try:
-            duration = int(args[0])
-        except ValueError:
-            await update.message.reply_text(
-                "Usage: /water [seconds]  (e.g. /water 10)"
-            )
-            return
-
-    if duration < 1 or duration > 30:
-        await update.message.reply_text(
-            "Duration must be between 1 and 30 seconds."
-        )
+    duration, error = _parse_duration(
+        context.args, 5, 1, 30, "Usage: /water [seconds]  (e.g. /water 10)"
+    )
+    if error:
+        await update.message.reply_text(error)
         return
 
     # Store pending action in user_data for the confirmation callback
@@ -391,22 +525,15 @@ async def circulation_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /circulation [sec] - manual circulation fan."""
-    args = context.args or []
-    duration = 60
-
-    if args:
-        try:
-            duration = int(args[0])
-        except ValueError:
-            await update.message.reply_text(
-                "Usage: /circulation [seconds]  (e.g. /circulation 120)"
-            )
-            return
-
-    if duration < 1 or duration > 3600:
-        await update.message.reply_text(
-            "Duration must be between 1 and 3600 seconds."
-        )
+    duration, error = _parse_duration(
+        context.args,
+        60,
+        1,
+        3600,
+        "Usage: /circulation [seconds]  (e.g. /circulation 120)",
+    )
+    if error:
+        await update.message.reply_text(error)
         return
 
     context.user_data["pending_action"] = {
@@ -456,51 +583,33 @@ async def profile_command(
 
         name = plant.get("name") or "(not set)"
         stage = plant.get("growth_stage", "unknown")
-
-        lines = [
-            "Plant Profile",
-            f"  Name: {name}",
-            f"  Stage: {stage}",
-            f"  Planted: {plant.get('planted_date') or 'N/A'}",
-        ]
-
-        if plant.get("notes"):
-            lines.append(f"  Notes: {plant['notes']}")
-
-        lines.append("")
-        lines.append("Ideal Conditions")
-        lines.append(
-            f"  Temp: {ideal.get('temp_min_c', '?')}"
-            f" - {ideal.get('temp_max_c', '?')} C"
-        )
-        lines.append(
-            f"  Humidity: {ideal.get('humidity_min_pct', '?')}"
-            f" - {ideal.get('humidity_max_pct', '?')}%"
-        )
-        lines.append(
-            f"  Soil: {ideal.get('soil_moisture_min_pct', '?')}"
-            f" - {ideal.get('soil_moisture_max_pct', '?')}%"
-        )
-        lines.append(
-            f"  Light: {ideal.get('light_hours', '?')} hours/day"
-        )
-        lines.append(
-            f"  CO2 min: {ideal.get('co2_min_ppm', '?')} ppm"
-        )
-        lines.append(
+        planted = plant.get("planted_date") or "N/A"
+        notes = plant.get("notes")
+        notes_line = f"  Notes: {notes}\n" if notes else ""
+
+        get = ideal.get
+        text = (
+            f"Plant Profile\n"
+            f"  Name: {name}\n"
+            f"  Stage: {stage}\n"
+            f"  Planted: {planted}\n"
+            f"{notes_line}"
+            f"\n"
+            f"Ideal Conditions\n"
+            f"  Temp: {get('temp_min_c', '?')} - {get('temp_max_c', '?')} C\n"
+            f"  Humidity: {get('humidity_min_pct', '?')} - {get('humidity_max_pct', '?')}%\n"
+            f"  Soil: {get('soil_moisture_min_pct', '?')} - {get('soil_moisture_max_pct', '?')}%\n"
+            f"  Light: {get('light_hours', '?')} hours/day\n"
+            f"  CO2 min: {get('co2_min_ppm', '?')} ppm\n"
             f"\nKnowledge cached: {'yes' if cached else 'no'}"
         )
 
         # Show knowledge file excerpt if it exists
-        knowledge_path = _data_dir(context) / "plant_knowledge.md"
-        if knowledge_path.exists():
-            content = knowledge_path.read_text()
-            # Show first 500 chars as preview
-            if len(content) > 500:
-                content = content[:500] + "..."
-            lines.append(f"\nResearch notes:\n{content}")
+        content = _read_prefix(_data_dir(context) / "plant_knowledge.md")
+        if content is not None:
+            text += f"\n\nResearch notes:\n{content}"
 
-        await _send_long_message(update.message, "\n".join(lines))
+        await _send_long_message(update.message, text)
 
     except Exception as exc:
         logger.exception("Error loading profile")
@@ -512,17 +621,12 @@ async def history_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /history [n] - show last N decisions."""
-    args = context.args or []
-    count = 5
-
-    if args:
-        try:
-            count = int(args[0])
-        except ValueError:
-            await update.message.reply_text("Usage: /history [n]")
-            return
+    count = _parse_int_arg(context.args, 5)
+    if count is None:
+        await update.message.reply_text("Usage: /history [n]")
+        return
 
-    count = max(1, min(count, 50))
+    count = min(max(count, 1), 50)
     decisions = _load_recent_decisions(_decisions_path(context), n=count)
 
     if not decisions:
@@ -551,6 +655,7 @@ async def pause_command(
     pause = _pause_file(context)
     pause.parent.mkdir(parents=True, exist_ok=True)
     pause.write_text(datetime.now().astimezone().isoformat())
+    context.bot_data["paused"] = True
     await update.message.reply_text(
         "Automated monitoring PAUSED.\n"
         "The bot will not run scheduled checks until you /resume."
@@ -562,15 +667,16 @@ async def resume_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Handle /resume - resume automated monitoring."""
-    pause = _pause_file(context)
-    if pause.exists():
-        pause.unlink()
-        await update.message.reply_text(
-            "Automated monitoring RESUMED.\n"
-            "Scheduled checks are active again."
-        )
-    else:
+    context.bot_data["paused"] = False
+    try:
+        _pause_file(context).unlink()
+    except FileNotFoundError:
         await update.message.reply_text("Monitoring is already active.")
+        return
+    await update.message.reply_text(
+        "Automated monitoring RESUMED.\n"
+        "Scheduled checks are active again."
+    )
 
 
 @authorized_only
@@ -680,7 +786,7 @@ async def confirm_callback(
 async def _inline_status(query: Any, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle inline status button from main menu."""
     try:
-        data = read_sensors(_farmctl_path(context))
+        data = await asyncio.to_thread(read_sensors, _farmctl_path(context))
         text = "Current Sensor Readings\n\n" + _format_sensor_data(data)
     except SensorReadError as exc:
         text = f"Failed to read sensors: {exc}"
@@ -720,7 +826,7 @@ async def _execute_pending_action(
 
     # Read sensors for safety validation
     try:
-        sensor_data = read_sensors(farmctl_path)
+        sensor_data = await asyncio.to_thread(read_sensors, farmctl_path)
     except (SensorReadError, Exception) as exc:
         logger.warning("Sensor read failed for manual action: %s", exc)
         await query.edit_message_text(
@@ -729,9 +835,6 @@ async def _execute_pending_action(
         )
         return
 
-    # Load history for rate limiting
-    history = load_recent_decisions(20, data_dir)
-
     # Execute through the shared validate -> execute -> log pipeline
     actions = [{
         "action": pending["action"],
@@ -747,11 +850,14 @@ async def _execute_pending_action(
 
     try:
         executor = ActionExecutor(farmctl_path, dry_run=dry_run)
-        results = execute_validated_actions(
+        # Off the event loop: the pipeline blocks on the shared action lock
+        # while a scheduled check is executing.
+        results = await asyncio.to_thread(
+            execute_validated_actions,
             actions=actions,
             decision_context=decision_context,
             sensor_data=sensor_data,
-            history=history,
+            history=None,
             executor=executor,
             data_dir=data_dir,
             dry_run=dry_run,
@@ -783,6 +889,25 @@ async def _execute_pending_action(
         await query.edit_message_text(f"Error executing action: {exc}")
 
 
+# Single-line JSON object following the IDEAL_JSON: marker in research replies.
+_IDEAL_JSON_RE = re.compile(r"IDEAL_JSON:\s*(\{[^\n]*\})")
+
+# AsyncAnthropic client reused across /setplant research calls, keyed by
+# API key so a changed key gets a fresh client.
+_research_client: tuple[str, Any] | None = None
+
+
+def _get_research_client(api_key: str) -> Any:
+    """Return a shared ``anthropic.AsyncAnthropic`` client for *api_key*."""
+    global _research_client
+
+    if _research_client is None or _research_client[0] != api_key:
+        import anthropic
+
+        _research_client = (api_key, anthropic.AsyncAnthropic(api_key=api_key))
+    return _research_client[1]
+
+
 async def _research_plant(
     query: Any,
     context: ContextTypes.DEFAULT_TYPE,
@@ -794,7 +919,7 @@ async def _research_plant(
     Results are saved to data/plant_knowledge.md and ideal conditions
     are updated in plant_profile.yaml.
     """
-    api_key = _bot_data(context, "anthropic_api_key")
+    api_key = _cfg(context).anthropic_api_key
     if not api_key:
         await query.message.reply_text(
             "ANTHROPIC_API_KEY not configured. Cannot research plant."
@@ -802,9 +927,7 @@ async def _research_plant(
         return
 
     try:
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_research_client(api_key)
 
         prompt = (
             f"I am growing {plant_name} (currently in the {stage} stage) "
@@ -826,7 +949,7 @@ async def _research_plant(
             f'"light_hours": 16, "co2_min_ppm": 400}}'
         )
 
-        response = client.messages.create(
+        response = await client.messages.create(
             model="claude-sonnet-4-6",
             max_tokens=1024,
             messages=[{"role": "user", "content": prompt}],
@@ -844,18 +967,15 @@ async def _research_plant(
         )
 
         # Try to extract and save ideal conditions JSON
-        if "IDEAL_JSON:" in content:
-            json_str = content.split("IDEAL_JSON:", 1)[1].strip()
-            # Handle case where there's text after the JSON
-            if "\n" in json_str:
-                json_str = json_str.split("\n", 1)[0]
+        match = _IDEAL_JSON_RE.search(content)
+        if match:
             try:
-                ideal = json.loads(json_str)
+                ideal = orjson.loads(match.group(1))
                 profile = load_plant_profile()
                 profile["ideal_conditions"] = ideal
                 profile["knowledge_cached"] = True
                 save_plant_profile(profile)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning("Could not parse ideal conditions JSON")
 
         await query.message.reply_text(
@@ -918,25 +1038,30 @@ async def chat_message_handler(
 
     await update.message.chat.send_action("typing")
 
-    # Read sensors (fallback to mock on error)
-    try:
-        sensor_data = read_sensors(_farmctl_path(context))
-    except (SensorReadError, Exception) as exc:
-        logger.warning("Sensor read failed in chat, using mock: %s", exc)
-        sensor_data = read_sensors_mock()
-
-    # Load context
+    farmctl_path = _farmctl_path(context)
     data_dir = str(_data_dir(context))
-    profile = load_plant_profile()
-    try:
-        hardware_profile = load_hardware_profile()
-    except FileNotFoundError:
-        hardware_profile = {}
-    history = load_recent_decisions(20, data_dir)
-    plant_log = load_recent_plant_log(20, data_dir)
-    actuator_state = reconcile_actuator_state(sensor_data.to_dict(), data_dir)
+
+    # Read sensors and load context concurrently in worker threads so the
+    # subprocess call and file reads don't block other updates. A failed
+    # sensor read falls back to mock data inside its worker.
+    (
+        sensor_data, profile, hardware_profile, history, plant_log,
+    ) = await asyncio.gather(
+        asyncio.to_thread(_read_sensors_or_mock, farmctl_path),
+        asyncio.to_thread(load_plant_profile),
+        asyncio.to_thread(_load_hardware_profile_or_empty),
+        asyncio.to_thread(load_recent_decisions, 20, data_dir),
+        asyncio.to_thread(load_recent_plant_log, 20, data_dir),
+    )
+    sensor_dict = sensor_data.to_dict()
+
+    actuator_state = await asyncio.to_thread(
+        reconcile_actuator_state, sensor_dict, data_dir
+    )
     try:
-        plant_knowledge = ensure_plant_knowledge(profile, data_dir)
+        plant_knowledge = await asyncio.to_thread(
+            ensure_plant_knowledge, profile, data_dir
+        )
     except ValueError as exc:
         await update.message.reply_text(
             f"No plant configured yet.\nUse /setplant <name> to set a plant first.\n\n({exc})"
@@ -946,12 +1071,15 @@ async def chat_message_handler(
         logger.warning("Plant knowledge unavailable in chat, continuing without it: %s", exc)
         plant_knowledge = ""
 
+    # Only hit the weather API once we know there's a plant to advise on
+    weather_data = await asyncio.to_thread(fetch_weather)
+
     # Get AI response
-    weather_data = fetch_weather()
     try:
-        response = get_chat_response(
+        response = await asyncio.to_thread(
+            get_chat_response,
             user_message=user_message,
-            sensor_data=sensor_data.to_dict(),
+            sensor_data=sensor_dict,
             plant_profile=profile,
             plant_knowledge=plant_knowledge,
             history=history,
@@ -2,11 +2,32 @@
 
 Provides reusable keyboard layouts for confirmations, plant stage
 selection, and the main menu quick actions.
+
+Keyboard markups are immutable in python-telegram-bot v20+, so the
+builders hand out shared instances instead of rebuilding them per call.
 """
 
+import functools
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 
+# Confirmation keyboards are memoized per action identifier (e.g. "water_10").
+# Durations are user-supplied, so the cache is bounded.
+@functools.lru_cache(maxsize=128)
+def _build_confirm_keyboard(action: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton(
+                "Yes, do it", callback_data=f"confirm:{action}"
+            ),
+            InlineKeyboardButton(
+                "Cancel", callback_data=f"cancel:{action}"
+            ),
+        ]
+    ])
+
+
 def confirm_action_keyboard(action: str) -> InlineKeyboardMarkup:
     """Yes/No confirmation for manual actions.
 
@@ -20,16 +41,18 @@ def confirm_action_keyboard(action: str) -> InlineKeyboardMarkup:
     Returns:
         Two-button inline keyboard: Confirm / Cancel.
     """
-    return InlineKeyboardMarkup([
-        [
-            InlineKeyboardButton(
-                "Yes, do it", callback_data=f"confirm:{action}"
-            ),
-            InlineKeyboardButton(
-                "Cancel", callback_data=f"cancel:{action}"
-            ),
-        ]
-    ])
+    return _build_confirm_keyboard(action)
+
+
+_PLANT_STAGE_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton(label, callback_data=data)]
+    for label, data in [
+        ("Seedling", "stage:seedling"),
+        ("Vegetative", "stage:vegetative"),
+        ("Flowering", "stage:flowering"),
+        ("Fruiting", "stage:fruiting"),
+    ]
+])
 
 
 def plant_stage_keyboard() -> InlineKeyboardMarkup:
@@ -39,16 +62,19 @@ def plant_stage_keyboard() -> InlineKeyboardMarkup:
         Four-button inline keyboard for seedling, vegetative,
         flowering, and fruiting stages.
     """
-    stages = [
-        ("Seedling", "stage:seedling"),
-        ("Vegetative", "stage:vegetative"),
-        ("Flowering", "stage:flowering"),
-        ("Fruiting", "stage:fruiting"),
-    ]
-    return InlineKeyboardMarkup([
-        [InlineKeyboardButton(label, callback_data=data)]
-        for label, data in stages
-    ])
+    return _PLANT_STAGE_KB
+
+
+_MAIN_MENU_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Status", callback_data="menu:status"),
+        InlineKeyboardButton("Photo", callback_data="menu:photo"),
+    ],
+    [
+        InlineKeyboardButton("History", callback_data="menu:history"),
+        InlineKeyboardButton("Profile", callback_data="menu:profile"),
+    ],
+])
 
 
 def main_menu_keyboard() -> InlineKeyboardMarkup:
@@ -57,13 +83,4 @@ def main_menu_keyboard() -> InlineKeyboardMarkup:
     Returns:
         Inline keyboard with Status, Photo, History, and Profile buttons.
     """
-    return InlineKeyboardMarkup([
-        [
-            InlineKeyboardButton("Status", callback_data="menu:status"),
-            InlineKeyboardButton("Photo", callback_data="menu:photo"),
-        ],
-        [
-            InlineKeyboardButton("History", callback_data="menu:history"),
-            InlineKeyboardButton("Profile", callback_data="menu:profile"),
-        ],
-    ])
+    return _MAIN_MENU_KB
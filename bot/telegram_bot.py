@@ -12,11 +12,15 @@ Environment variables:
     DATA_DIR            - Data directory (default: data/)
     AGENT_MODE          - "dry-run" (default) or "live"
     ANTHROPIC_API_KEY   - Claude API key for AI decisions
+    WEBHOOK_URL         - Public HTTPS base URL; enables webhook mode (optional)
+    WEBHOOK_PORT        - Local port for the webhook server (default: 8443)
+    WEBHOOK_SECRET      - Secret token Telegram sends with each update (optional)
 """
 
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
 import os
 import sys
@@ -36,6 +40,7 @@ from telegram.ext import (
 )
 
 from bot.handlers import (
+    BotConfig,
     _split_text,
     chat_message_handler,
     circulation_command,
@@ -67,6 +72,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of updates processed concurrently. Kept small since the
+# bot runs on a Raspberry Pi and most handlers shell out to farmctl.py.
+CONCURRENT_UPDATES: int = 8
+
+# Only the update kinds we have handlers for; everything else (edits,
+# chat_member, polls, ...) would be fetched and parsed just to be dropped.
+ALLOWED_UPDATES: list[str] = [Update.MESSAGE, Update.CALLBACK_QUERY]
+
+# Server-side long-poll timeout for getUpdates, in seconds.
+POLL_TIMEOUT_SECONDS: int = 50
+
 
 # ---------------------------------------------------------------------------
 # Heartbeat job
@@ -80,8 +96,7 @@ async def heartbeat_job(context: ContextTypes.DEFAULT_TYPE) -> None:
     (running but not processing the job queue). If this file is not
     updated within 10 minutes the watchdog restarts the service.
     """
-    data_dir = context.bot_data.get("data_dir", "data")
-    heartbeat_file = Path(data_dir) / ".heartbeat"
+    heartbeat_file = context.bot_data["cfg"].data_dir / ".heartbeat"
     try:
         heartbeat_file.write_text(datetime.now().astimezone().isoformat())
     except Exception:
@@ -92,11 +107,48 @@ async def heartbeat_job(context: ContextTypes.DEFAULT_TYPE) -> None:
 # Scheduled monitoring
 # ---------------------------------------------------------------------------
 
-# Counter for photo frequency (take a photo every Nth check to save costs)
-_check_counter: int = 0
+# Take a photo every Nth check to save costs
+CHECK_INTERVAL_SECONDS: int = 3600
 PHOTO_EVERY_N_CHECKS: int = 4
 
 
+async def _send_to_chat(
+    bot, chat_id: int, chunks: list[str], photo: bytes | str | None
+) -> str | None:
+    """Send the scheduled summary (and photo, if any) to a single chat.
+
+    ``photo`` is either the raw JPEG bytes or the ``file_id`` of a copy
+    already uploaded to Telegram. Returns the ``file_id`` of the sent
+    photo so later recipients can reuse it, or None.
+
+    Errors are logged here rather than raised so that a failure for one
+    chat does not affect delivery to the others.
+    """
+    try:
+        for chunk in chunks:
+            await bot.send_message(chat_id=chat_id, text=chunk)
+        if photo is not None:
+            msg = await bot.send_photo(
+                chat_id=chat_id,
+                photo=io.BytesIO(photo) if isinstance(photo, bytes) else photo,
+                caption="Scheduled plant photo",
+            )
+            if msg.photo:
+                return msg.photo[-1].file_id
+    except BadRequest as exc:
+        if "chat not found" in str(exc).lower():
+            logger.error(
+                "Chat ID %s not found - check TELEGRAM_CHAT_ID "
+                "in .env. Send /start to the bot first.",
+                chat_id,
+            )
+        else:
+            logger.error("Telegram error sending to %s: %s", chat_id, exc)
+    except Exception:
+        logger.warning("Failed to send scheduled check to %s", chat_id)
+    return None
+
+
 async def scheduled_check(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Run the automated plant monitoring check.
 
@@ -104,66 +156,64 @@ async def scheduled_check(context: ContextTypes.DEFAULT_TYPE) -> None:
     which handles the full sense -> think -> act pipeline, then sends the
     summary to the authorized Telegram chat.
 
-    Skips silently if the pause file exists.
-    """
-    global _check_counter
+    Whether a photo is taken is decided by which job fired: the job's
+    ``data`` carries ``{"take_photo": bool}`` (see _schedule_checks).
 
+    Skips silently if monitoring is paused.
+    """
     bot_data = context.bot_data
-    data_dir = bot_data.get("data_dir", "data")
-    pause_file = Path(data_dir) / ".paused"
-    chat_ids = bot_data.get("authorized_chat_ids", [])
-    farmctl_path = bot_data.get("farmctl_path", "")
-    agent_mode = bot_data.get("agent_mode", "dry-run")
-
-    # Skip if paused
-    if pause_file.exists():
+    cfg: BotConfig = bot_data["cfg"]
+    chat_ids = cfg.chat_ids
+
+    # Skip if paused (flag mirrors data/.paused; see pause/resume_command)
+    if bot_data.get("paused"):
         logger.info("Scheduled check skipped (paused)")
         return
 
-    _check_counter += 1
-    take_photo = (_check_counter % PHOTO_EVERY_N_CHECKS == 1)
+    job = context.job
+    take_photo = bool(job and job.data and job.data.get("take_photo"))
 
     try:
-        summary = run_check(
-            farmctl_path=farmctl_path,
-            data_dir=data_dir,
-            dry_run=(agent_mode != "live"),
+        # Sense -> think -> act blocks on farmctl, the camera and the Claude
+        # API; run it off the event loop so commands stay responsive.
+        summary = await asyncio.to_thread(
+            run_check,
+            farmctl_path=cfg.farmctl_path,
+            data_dir=str(cfg.data_dir),
+            dry_run=(bot_data.get("agent_mode") != "live"),
             use_mock=False,
             include_photo=take_photo,
         )
 
         # Send summary to all authorized users
         if chat_ids:
-            text = format_summary_text(summary)
+            chunks = list(_split_text(format_summary_text(summary)))
+            photo_bytes = None
             photo_path = summary.get("photo_path")
-            has_photo = photo_path and Path(photo_path).exists()
-
-            for chat_id in chat_ids:
+            if photo_path:
                 try:
-                    for chunk in _split_text(text):
-                        await context.bot.send_message(chat_id=chat_id, text=chunk)
-                    if has_photo:
-                        with open(photo_path, "rb") as f:
-                            await context.bot.send_photo(
-                                chat_id=chat_id,
-                                photo=f,
-                                caption="Scheduled plant photo",
-                            )
-                except BadRequest as exc:
-                    if "chat not found" in str(exc).lower():
-                        logger.error(
-                            "Chat ID %s not found - check TELEGRAM_CHAT_ID "
-                            "in .env. Send /start to the bot first.",
-                            chat_id,
-                        )
-                    else:
-                        logger.error(
-                            "Telegram error sending to %s: %s", chat_id, exc
-                        )
-                except Exception:
-                    logger.warning(
-                        "Failed to send scheduled check to %s", chat_id
+                    photo_bytes = await asyncio.to_thread(
+                        Path(photo_path).read_bytes
                     )
+                except OSError:
+                    logger.warning("Scheduled photo %s not readable", photo_path)
+
+            # Upload the photo once; the remaining chats get Telegram's
+            # file_id so the JPEG only leaves the Pi a single time.
+            first, *rest = chat_ids
+            photo: bytes | str | None = photo_bytes
+            file_id = await _send_to_chat(context.bot, first, chunks, photo)
+            if file_id:
+                photo = file_id
+
+            # Fan out so one slow or unreachable chat doesn't hold up the rest
+            await asyncio.gather(
+                *(
+                    _send_to_chat(context.bot, chat_id, chunks, photo)
+                    for chat_id in rest
+                ),
+                return_exceptions=True,
+            )
 
     except Exception as exc:
         logger.exception("Scheduled check failed")
@@ -182,6 +232,26 @@ async def scheduled_check(context: ContextTypes.DEFAULT_TYPE) -> None:
                 logger.exception("Failed to send error notification")
 
 
+def _schedule_checks(job_queue, first: float = 10) -> None:
+    """Register the hourly monitoring checks on *job_queue*.
+
+    Instead of counting checks at runtime, the photo cadence is laid out
+    as PHOTO_EVERY_N_CHECKS staggered jobs that each repeat every N hours:
+    the first (photo) job fires at *first*, and the others follow one
+    interval apart without a photo. The combined schedule is one check per
+    hour with a photo on checks 1, N+1, 2N+1, ...
+    """
+    period = CHECK_INTERVAL_SECONDS * PHOTO_EVERY_N_CHECKS
+    for slot in range(PHOTO_EVERY_N_CHECKS):
+        job_queue.run_repeating(
+            scheduled_check,
+            interval=period,
+            first=first + slot * CHECK_INTERVAL_SECONDS,
+            data={"take_photo": slot == 0},
+            name=f"scheduled_check_{slot}",
+        )
+
+
 # ---------------------------------------------------------------------------
 # Error handler
 # ---------------------------------------------------------------------------
@@ -204,9 +274,7 @@ async def _error_handler(
             "Kill the other process first, then restart."
         )
         # Stop this instance to avoid endless 409 retry loops
-        asyncio.get_event_loop().call_soon(
-            lambda: asyncio.ensure_future(context.application.updater.stop())
-        )
+        context.application.create_task(context.application.updater.stop())
         return
 
     if isinstance(err, BadRequest) and "chat not found" in str(err).lower():
@@ -226,7 +294,7 @@ async def _error_handler(
 
 async def _post_init(application: Application) -> None:
     """Validate configuration after the bot connects to Telegram."""
-    chat_ids = application.bot_data.get("authorized_chat_ids", [])
+    chat_ids = application.bot_data["cfg"].chat_ids
     if not chat_ids:
         return
     for chat_id in chat_ids:
@@ -248,12 +316,33 @@ async def _post_init(application: Application) -> None:
 # Bot setup and main
 # ---------------------------------------------------------------------------
 
+# Slash commands and their handlers, registered in this order.
+_COMMANDS = (
+    ("start", start_command),
+    ("help", help_command),
+    ("status", status_command),
+    ("photo", photo_command),
+    ("water", water_command),
+    ("light", light_command),
+    ("heater", heater_command),
+    ("circulation", circulation_command),
+    ("setplant", setplant_command),
+    ("profile", profile_command),
+    ("history", history_command),
+    ("pause", pause_command),
+    ("resume", resume_command),
+    ("mode", mode_command),
+    ("restart", restart_command),
+)
+
+
 def main() -> None:
     """Start the Telegram bot.
 
     Loads configuration from environment variables, builds the
     python-telegram-bot Application, registers all command handlers,
-    sets up the hourly scheduled check, and starts long-polling.
+    sets up the hourly scheduled check, and starts receiving updates
+    (webhook if WEBHOOK_URL is set, long-polling otherwise).
     """
     # Load .env file if present (for local development)
     load_dotenv()
@@ -265,7 +354,15 @@ def main() -> None:
         sys.exit(1)
 
     chat_id_str = os.getenv("TELEGRAM_CHAT_ID", "")
-    chat_ids = [cid.strip() for cid in chat_id_str.split(",") if cid.strip()]
+    try:
+        chat_ids = tuple(
+            int(cid) for cid in map(str.strip, chat_id_str.split(",")) if cid
+        )
+    except ValueError as exc:
+        # Refuse to start rather than silently dropping an ID, which could
+        # leave the list empty and open the bot to everyone.
+        logger.error("Invalid TELEGRAM_CHAT_ID %r: %s", chat_id_str, exc)
+        sys.exit(1)
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     farmctl_default = os.path.join(project_root, "farmctl", "farmctl.py")
     farmctl_path = os.getenv("FARMCTL_PATH", farmctl_default)
@@ -291,58 +388,56 @@ def main() -> None:
         Application.builder()
         .token(bot_token)
         .post_init(_post_init)
+        .concurrent_updates(CONCURRENT_UPDATES)
         .build()
     )
 
     # Store config in bot_data for handlers to access
-    application.bot_data["authorized_chat_ids"] = chat_ids
-    application.bot_data["farmctl_path"] = farmctl_path
-    application.bot_data["data_dir"] = data_dir
+    cfg = BotConfig(
+        data_dir=Path(data_dir),
+        chat_ids=chat_ids,
+        farmctl_path=farmctl_path,
+        anthropic_api_key=anthropic_key,
+    )
+    application.bot_data["cfg"] = cfg
     application.bot_data["agent_mode"] = agent_mode
-    application.bot_data["anthropic_api_key"] = anthropic_key
+    # Pause state persists across restarts via data/.paused; read it once here
+    # and let /pause and /resume keep the in-memory flag in sync.
+    application.bot_data["paused"] = cfg.pause_file.exists()
 
     # --- Register command handlers -----------------------------------------
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("status", status_command))
-    application.add_handler(CommandHandler("photo", photo_command))
-    application.add_handler(CommandHandler("water", water_command))
-    application.add_handler(CommandHandler("light", light_command))
-    application.add_handler(CommandHandler("heater", heater_command))
-    application.add_handler(CommandHandler("circulation", circulation_command))
-    application.add_handler(CommandHandler("setplant", setplant_command))
-    application.add_handler(CommandHandler("profile", profile_command))
-    application.add_handler(CommandHandler("history", history_command))
-    application.add_handler(CommandHandler("pause", pause_command))
-    application.add_handler(CommandHandler("resume", resume_command))
-    application.add_handler(CommandHandler("mode", mode_command))
-    application.add_handler(CommandHandler("restart", restart_command))
-
-    # Natural language chat handler (catches all non-command text)
-    application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, chat_message_handler)
+    application.add_handlers(
+        [CommandHandler(name, callback) for name, callback in _COMMANDS]
+        + [
+            # Natural language chat handler (catches all non-command text).
+            # Non-blocking so a slow Claude call doesn't hold up other updates.
+            MessageHandler(
+                filters.TEXT & ~filters.COMMAND,
+                chat_message_handler,
+                block=False,
+            ),
+            # Callback query handler for inline keyboard buttons (may
+            # trigger plant research, which takes ~30 seconds)
+            CallbackQueryHandler(confirm_callback, block=False),
+        ]
     )
 
-    # Callback query handler for inline keyboard buttons
-    application.add_handler(CallbackQueryHandler(confirm_callback))
-
     # Global error handler (catches Conflict, BadRequest, etc. cleanly)
     application.add_error_handler(_error_handler)
 
     # --- Schedule hourly monitoring check and heartbeat --------------------
     job_queue = application.job_queue
     if job_queue is not None:
-        job_queue.run_repeating(
-            scheduled_check,
-            interval=3600,    # every hour
-            first=10,         # first run 10 seconds after startup
-        )
+        _schedule_checks(job_queue, first=10)  # first run 10s after startup
         job_queue.run_repeating(
             heartbeat_job,
             interval=300,     # every 5 minutes
             first=5,
         )
-        logger.info("Scheduled monitoring check registered (every 3600s)")
+        logger.info(
+            "Scheduled monitoring check registered (every %ds, photo every "
+            "%d checks)", CHECK_INTERVAL_SECONDS, PHOTO_EVERY_N_CHECKS,
+        )
         logger.info("Heartbeat job registered (every 300s)")
     else:
         logger.warning(
@@ -350,16 +445,40 @@ def main() -> None:
             "for scheduled checks."
         )
 
-    # --- Start polling -----------------------------------------------------
+    # --- Start receiving updates ---------------------------------------------
     logger.info(
         "Plant-Ops AI bot starting (mode=%s, authorized_users=%s)",
         agent_mode,
         len(chat_ids) if chat_ids else "ANY",
     )
-    application.run_polling(
-        allowed_updates=Update.ALL_TYPES,
-        drop_pending_updates=True,
-    )
+
+    webhook_url = os.getenv("WEBHOOK_URL", "").rstrip("/")
+    if webhook_url:
+        # Telegram pushes updates to us; no getUpdates round-trips.
+        # Requires: pip install "python-telegram-bot[webhooks]"
+        port = int(os.getenv("WEBHOOK_PORT", "8443"))
+        logger.info("Receiving updates via webhook on port %d", port)
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=port,
+            url_path=bot_token,
+            webhook_url=f"{webhook_url}/{bot_token}",
+            secret_token=os.getenv("WEBHOOK_SECRET") or None,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True,
+        )
+    else:
+        # Long-poll for up to 50s per getUpdates (Telegram's maximum) so an
+        # idle bot makes a handful of requests per minute instead of ~6.
+        # Keep retrying the initial connection; on boot the Pi's network
+        # may not be up yet.
+        application.run_polling(
+            poll_interval=0.0,
+            timeout=POLL_TIMEOUT_SECONDS,
+            bootstrap_retries=-1,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True,
+        )
 
 
 if __name__ == "__main__":
@@ -13,14 +13,14 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import errno
 import json
 import os
-import re
 import shlex
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
 try:
@@ -28,103 +28,269 @@ try:
 except Exception:
     serial = None
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize --json output; orjson when available (UTF-8, like ensure_ascii=False)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
 
 DEFAULT_SERIAL = "/dev/ttyACM0"
 DEFAULT_BAUD = 115200
+# A reply is complete once the board has been quiet for this long.
+READ_IDLE_S = 0.15
+# serial_status() reuses a reading at most this old (seconds).
+STATUS_MAX_AGE_S = 2.0
+# The port is opened exclusively; wait this long for another process
+# (the bot or another farmctl run) to release it before giving up.
+PORT_LOCK_WAIT_S = 10.0
+
+# Characters that may appear in a CSV status line from the Arduino's
+# printCSV(), e.g. "609,23.57,67.95,54,1023,1,0,0,0,0,0,0,0".
+_CSV_CHARS = frozenset("0123456789.,+- ")
+
+
+def _is_csv_line(ln: str) -> bool:
+    """True if *ln* looks like a printCSV() status line.
+
+    A linear character-set scan instead of a regex: starts with a digit,
+    has at least the five sensor fields, and contains only numeric
+    characters, separators and spaces.
+    """
+    return ln[0].isdigit() and ln.count(",") >= 4 and _CSV_CHARS.issuperset(ln)
+
 
+def run(argv: list[str], timeout: int = 15) -> tuple[int, str, str]:
+    rc, out, err = run_bytes(argv, timeout=timeout)
+    return rc, out.decode("utf-8", errors="ignore").strip(), err
 
-def run(cmd: str, timeout: int = 15) -> tuple[int, str, str]:
-    p = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout)
-    return p.returncode, p.stdout.strip(), p.stderr.strip()
+
+def run_bytes(argv: list[str], timeout: int = 15) -> tuple[int, bytes, str]:
+    """Like run(), but return stdout as raw bytes (e.g. an image on a pipe).
+
+    Executes *argv* directly (no shell). A missing executable is reported
+    as exit code 127, as a shell would.
+    """
+    try:
+        p = subprocess.run(argv, capture_output=True, timeout=timeout)
+    except FileNotFoundError:
+        return 127, b"", f"{argv[0]}: not found"
+    return p.returncode, p.stdout, p.stderr.decode("utf-8", errors="ignore").strip()
 
 
 @dataclass
 class SerialClient:
     port: str = DEFAULT_SERIAL
     baud: int = DEFAULT_BAUD
+    # Upper bound on how long one send() keeps reading a reply.
     timeout_s: float = 2.0
-
-    def send(self, command: str, read_s: float = 1.2) -> str:
+    lock_wait_s: float = PORT_LOCK_WAIT_S
+    # Opened lazily (and exclusively) on first send() and kept open until
+    # close(), so several commands in one process share a single port
+    # open/configure.
+    _ser: Any = field(default=None, init=False, repr=False)
+    # Last parsed status and when it was read (time.monotonic()); see
+    # serial_status(). Cleared by any send(), since commands change relays.
+    _status: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _status_at: float = field(default=0.0, init=False, repr=False)
+
+    def _open(self) -> Any:
         if serial is None:
             raise RuntimeError("pyserial not installed. Run: python3 -m pip install pyserial")
-        with serial.Serial(self.port, self.baud, timeout=self.timeout_s) as ser:
+        # Reads block for at most READ_IDLE_S, which is how send() detects
+        # the end of a reply. exclusive=True takes an flock on the tty, so
+        # a CLI run and the bot never read each other's replies.
+        deadline = time.monotonic() + self.lock_wait_s
+        while True:
+            try:
+                ser = serial.Serial(self.port, self.baud, timeout=READ_IDLE_S, exclusive=True)
+                break
+            except serial.SerialException as exc:
+                if exc.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"serial port {self.port} is busy (in use by the bot or another farmctl run)"
+                    ) from exc
+                time.sleep(0.2)
+        # Ask the USB-serial driver to deliver bytes immediately instead of
+        # batching them for its latency timer (16 ms on FTDI by default).
+        # Linux-only in pyserial; best effort elsewhere.
+        try:
+            ser.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError):
+            pass
+        self._ser = ser
+        return ser
+
+    def close(self) -> None:
+        if self._ser is not None:
+            self._ser.close()
+            self._ser = None
+
+    def __enter__(self) -> "SerialClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def send(self, command: str, read_s: float = 1.2) -> str:
+        """Write *command* and return the board's reply.
+
+        Waits up to *read_s* for the reply to start, then reads lines
+        until the port has been idle for READ_IDLE_S (capped at
+        ``timeout_s`` overall), instead of always sleeping *read_s*.
+        """
+        self._status = None
+        ser = self._ser or self._open()
+        try:
             ser.reset_input_buffer()
             ser.reset_output_buffer()
             ser.write((command.strip() + "\n").encode("utf-8"))
             ser.flush()
-            time.sleep(read_s)
-            data = ser.read_all().decode("utf-8", errors="ignore")
-            return data.strip()
+            start = time.monotonic()
+            lines: list[bytes] = []
+            while True:
+                line = ser.read_until(b"\n", 4096)
+                elapsed = time.monotonic() - start
+                if line:
+                    lines.append(line)
+                    if elapsed >= self.timeout_s:
+                        break
+                elif lines or elapsed >= read_s:
+                    break
+            data = b"".join(lines).decode("utf-8", errors="ignore")
+        except Exception:
+            # Drop a port that errored (e.g. board unplugged); the next
+            # send() reopens it.
+            self.close()
+            raise
+        return data.strip()
 
 
 def parse_csv_status(line: str) -> Dict[str, Any]:
     # CSV format from Arduino printCSV():
     # co2,tempC,rh,lightRaw,soilRaw,waterOK,lightOn,heaterOn,heaterLockout,waterOn,circOn,waterRem,circRem
     # Example: 609,23.57,67.95,54,1023,1,0,0,0,0,0,0,0
-    parts = [p.strip() for p in line.split(",") if p.strip() != ""]
+    parts = line.split(",")
+    if "" in parts or " " in line:
+        parts = [p.strip() for p in parts if p.strip() != ""]
     out: Dict[str, Any] = {"raw": line, "fields": parts}
     if len(parts) >= 5:
         try:
-            out.update(
-                {
-                    "co2_ppm": float(parts[0]),
-                    "temp_c": float(parts[1]),
-                    "humidity_pct": float(parts[2]),
-                    "light_raw": float(parts[3]),
-                    "soil_raw": float(parts[4]),
-                }
-            )
+            co2, temp, rh, light_raw, soil_raw = map(float, parts[:5])
         except ValueError:
             pass
+        else:
+            out["co2_ppm"] = co2
+            out["temp_c"] = temp
+            out["humidity_pct"] = rh
+            out["light_raw"] = light_raw
+            out["soil_raw"] = soil_raw
     # Extended fields: relay states, water tank, heater lockout, timers
     if len(parts) >= 13:
         try:
-            out.update(
-                {
-                    "water_tank_ok": int(parts[5]) == 1,
-                    "light_on": int(parts[6]) == 1,
-                    "heater_on": int(parts[7]) == 1,
-                    "heater_lockout": int(parts[8]) == 1,
-                    "water_pump_on": int(parts[9]) == 1,
-                    "circulation_on": int(parts[10]) == 1,
-                    "water_pump_remaining_sec": int(parts[11]),
-                    "circulation_remaining_sec": int(parts[12]),
-                }
+            water_ok, light, heater, lockout, pump, circ, pump_rem, circ_rem = map(
+                int, parts[5:13]
             )
         except ValueError:
             pass
+        else:
+            out["water_tank_ok"] = water_ok == 1
+            out["light_on"] = light == 1
+            out["heater_on"] = heater == 1
+            out["heater_lockout"] = lockout == 1
+            out["water_pump_on"] = pump == 1
+            out["circulation_on"] = circ == 1
+            out["water_pump_remaining_sec"] = pump_rem
+            out["circulation_remaining_sec"] = circ_rem
     return out
 
 
-def serial_status(sc: SerialClient) -> Dict[str, Any]:
+def serial_status(sc: SerialClient, max_age_s: float = STATUS_MAX_AGE_S) -> Dict[str, Any]:
+    # Back-to-back reads (e.g. a chat reply and the action it proposes)
+    # reuse a status that is younger than max_age_s instead of another
+    # serial round-trip.
+    if sc._status is not None and time.monotonic() - sc._status_at < max_age_s:
+        return dict(sc._status)
+
     # prefer CSV read for machine parsing
     raw = sc.send("r")
     # pick last csv-looking line
     lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
     csv_line = ""
     for ln in reversed(lines):
-        if re.match(r"^\d+([.,]\d+)?(,\s*[-+]?\d+([.,]\d+)?)+$", ln):
+        if _is_csv_line(ln):
             csv_line = ln.replace(" ", "")
             break
-    parsed = parse_csv_status(csv_line) if csv_line else {"raw": raw}
+    if not csv_line:
+        return {"raw": raw, "source": "serial:r"}
+    parsed = parse_csv_status(csv_line)
     parsed["source"] = "serial:r"
-    return parsed
+    sc._status, sc._status_at = parsed, time.monotonic()
+    return dict(parsed)
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write *data* to *path* through a uniquely named sibling temp file.
+
+    Readers never see a half-written file and concurrent writers never
+    share a temp file. The temp file is opened with mode 0o666 so a new
+    target gets the umask default; an existing target's mode is copied.
+    """
+    try:
+        mode: Optional[int] = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    directory, name = os.path.split(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    for _ in range(10000):
+        tmp_path = os.path.join(directory, f"{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    else:
+        raise FileExistsError(errno.EEXIST, "No usable temporary file name found", path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def camera_snap(out_path: str, timeout_ms: int = 1200) -> Dict[str, Any]:
     out_path = os.path.expanduser(out_path)
-    cmd = f"rpicam-still -o {shlex.quote(out_path)} -t {int(timeout_ms)} --nopreview --ev -1"
-    rc, out, err = run(cmd, timeout=20)
-    exists = os.path.exists(out_path)
-    size = os.path.getsize(out_path) if exists else 0
+    # JPEG comes back on stdout, so its size is known without stat'ing the
+    # file, and a stale photo from an earlier run can't be mistaken for
+    # success.
+    argv = ["rpicam-still", "-o", "-", "-t", str(int(timeout_ms)), "--nopreview", "--ev", "-1"]
+    rc, data, err = run_bytes(argv, timeout=20)
+    ok = rc == 0 and len(data) > 0
+    if ok:
+        _atomic_write_bytes(out_path, data)
     return {
-        "ok": rc == 0 and exists,
-        "cmd": cmd,
+        "ok": ok,
+        "cmd": shlex.join(argv),
         "rc": rc,
-        "stdout": out,
+        "stdout": "",
         "stderr": err,
         "path": out_path,
-        "bytes": size,
+        "bytes": len(data),
     }
 
 
@@ -168,57 +334,64 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def execute(argv: list[str], sc: Optional[SerialClient] = None) -> tuple[int, str, str]:
+    """Run one farmctl command in-process.
+
+    Returns (exit_code, stdout, stderr) exactly as the CLI would produce
+    them, so callers can skip spawning ``python3 farmctl.py``. Pass *sc*
+    to reuse an already-open serial connection; --port/--baud in *argv*
+    are ignored in that case.
+    """
+    args = build_parser().parse_args(argv)
+    if sc is not None:
+        return _run_subcommand(args, sc)
+    with SerialClient(port=args.port, baud=args.baud) as sc:
+        return _run_subcommand(args, sc)
+
+
 def main() -> int:
-    args = build_parser().parse_args()
-    sc = SerialClient(port=args.port, baud=args.baud)
+    rc, out, err = execute(sys.argv[1:])
+    if out:
+        print(out)
+    if err:
+        print(err, file=sys.stderr)
+    return rc
+
 
+def _run_subcommand(args: argparse.Namespace, sc: SerialClient) -> tuple[int, str, str]:
     try:
         if args.sub == "status":
             data = serial_status(sc)
-            if args.json:
-                print(json.dumps(data, ensure_ascii=False))
-            else:
-                print(data)
-            return 0
+            return 0, _dumps(data) if args.json else str(data), ""
 
         if args.sub == "cmd":
-            print(act(sc, args.text)["raw"])
-            return 0
+            return 0, act(sc, args.text)["raw"], ""
 
         if args.sub == "light":
             cmd = "lon" if args.state == "on" else "loff"
-            print(act(sc, cmd)["raw"])
-            return 0
+            return 0, act(sc, cmd)["raw"], ""
 
         if args.sub == "heater":
             cmd = "hon" if args.state == "on" else "hoff"
-            print(act(sc, cmd)["raw"])
-            return 0
+            return 0, act(sc, cmd)["raw"], ""
 
         if args.sub == "pump":
             cmd = f"w_on,{args.sec}" if args.state == "on" else "w_off"
-            print(act(sc, cmd)["raw"])
-            return 0
+            return 0, act(sc, cmd)["raw"], ""
 
         if args.sub == "circulation":
             cmd = f"c_on,{args.sec}" if args.state == "on" else "c_off"
-            print(act(sc, cmd)["raw"])
-            return 0
+            return 0, act(sc, cmd)["raw"], ""
 
         if args.sub == "camera-snap":
             data = camera_snap(args.out, args.timeout_ms)
-            if args.json:
-                print(json.dumps(data, ensure_ascii=False))
-            else:
-                print(data)
-            return 0 if data.get("ok") else 2
+            out = _dumps(data) if args.json else str(data)
+            return (0 if data.get("ok") else 2), out, ""
 
-        print("unknown subcommand", file=sys.stderr)
-        return 2
+        return 2, "", "unknown subcommand"
 
     except Exception as e:
-        print(f"ERROR: {e}", file=sys.stderr)
-        return 1
+        return 1, "", f"ERROR: {e}"
 
 
 if __name__ == "__main__":
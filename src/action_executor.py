@@ -1,8 +1,9 @@
 """Action executor for plant-ops-ai.
 
-Executes validated actions by calling farmctl.py commands via subprocess.
-Acts as the bridge between AI decisions and physical hardware (relays,
-pump, lights, heater, circulation fan, camera).
+Executes validated actions by running farmctl.py commands -- in-process
+when the script can be imported (see src.farmctl_runner), otherwise via
+subprocess. Acts as the bridge between AI decisions and physical hardware
+(relays, pump, lights, heater, circulation fan, camera).
 
 Supports dry-run mode for local development and testing without hardware.
 """
@@ -11,10 +12,13 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Any
 
+from src.farmctl_runner import load_farmctl
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,25 +49,50 @@ class ExecutionResult:
         return asdict(self)
 
 
-# Maps action names to farmctl.py argument builders.
-# Each value is a callable: (params: dict) -> list[str]
-# The returned list is appended to ["python3", farmctl_path].
-_ACTION_MAP: dict[str, Any] = {
-    "water": lambda p: ["pump", "on", "--sec", str(p.get("duration_sec", 5))],
-    "light_on": lambda _: ["light", "on"],
-    "light_off": lambda _: ["light", "off"],
-    "heater_on": lambda _: ["heater", "on"],
-    "heater_off": lambda _: ["heater", "off"],
-    "circulation": lambda p: [
-        "circulation",
-        "on",
-        "--sec",
-        str(p.get("duration_sec", 30)),
-    ],
+# Maps every known action name to farmctl.py arguments: (argv prefix,
+# default duration_sec). Timed actions get ``str(duration_sec)`` appended;
+# fixed actions (default None) use the prefix as-is. No-op actions have an
+# empty prefix and send no hardware command. The full command is
+# ["python3", farmctl_path] + argv.
+_ACTION_ARGV: dict[str, tuple[tuple[str, ...], int | None]] = {
+    "do_nothing": ((), None),
+    "notify_human": ((), None),
+    "water": (("pump", "on", "--sec"), 5),
+    "light_on": (("light", "on"), None),
+    "light_off": (("light", "off"), None),
+    "heater_on": (("heater", "on"), None),
+    "heater_off": (("heater", "off"), None),
+    "circulation": (("circulation", "on", "--sec"), 30),
 }
 
-# Actions that require no hardware command.
-_NOOP_ACTIONS = frozenset({"do_nothing", "notify_human"})
+
+def _build_argv(action_name: str, params: dict[str, Any]) -> list[str] | None:
+    """Return farmctl.py arguments for *action_name*, or None if unknown.
+
+    No-op actions (do_nothing, notify_human) return an empty list.
+    """
+    entry = _ACTION_ARGV.get(action_name)
+    if entry is None:
+        return None
+    prefix, default_sec = entry
+    if default_sec is None:
+        return list(prefix)
+    return [*prefix, str(params.get("duration_sec", default_sec))]
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds, e.g.
+    ``2026-02-18T10:30:00.123456+00:00``.
+
+    Formats from ``time.time_ns()`` directly rather than building a
+    ``datetime`` for every executed action.
+    """
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))}.{ns // 1000:06d}+00:00"
+
+
+# farmctl.py camera-snap's default pre-capture run time (rpicam-still -t).
+CAMERA_TIMEOUT_MS = 1200
 
 
 class ActionExecutor:
@@ -77,6 +106,8 @@ class ActionExecutor:
     def __init__(self, farmctl_path: str, dry_run: bool = False) -> None:
         self._farmctl_path = farmctl_path
         self._dry_run = dry_run
+        # Leading part of the human-readable command string for logs/results
+        self._command_prefix = f"python3 {farmctl_path} "
 
         if dry_run:
             logger.info("ActionExecutor initialised in DRY-RUN mode")
@@ -104,10 +135,13 @@ class ActionExecutor:
         """
         action_name: str = action.get("action", "")
         params: dict[str, Any] = action.get("params", {})
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
+
+        # --- Look up the farmctl arguments (one table for all actions) ---
+        farmctl_args = _build_argv(action_name, params)
 
         # --- No-op actions (do_nothing, notify_human) -----------------
-        if action_name in _NOOP_ACTIONS:
+        if farmctl_args == []:
             logger.info("Action '%s' requires no hardware command", action_name)
             return ExecutionResult(
                 success=True,
@@ -119,9 +153,8 @@ class ActionExecutor:
                 timestamp=now,
             )
 
-        # --- Look up the farmctl argument builder ---------------------
-        builder = _ACTION_MAP.get(action_name)
-        if builder is None:
+        # --- Unknown action ------------------------------------------
+        if farmctl_args is None:
             logger.error("Unknown action: '%s'", action_name)
             return ExecutionResult(
                 success=False,
@@ -133,8 +166,7 @@ class ActionExecutor:
                 timestamp=now,
             )
 
-        farmctl_args: list[str] = builder(params)
-        command_str = f"python3 {self._farmctl_path} {' '.join(farmctl_args)}"
+        command_str = self._command_prefix + " ".join(farmctl_args)
 
         # --- Dry-run mode: log but don't execute ---------------------
         if self._dry_run:
@@ -168,19 +200,26 @@ class ActionExecutor:
             timestamp=now,
         )
 
-    def take_photo(self, output_path: str) -> str | None:
+    def take_photo(
+        self, output_path: str, timeout_ms: int | None = None
+    ) -> str | None:
         """Capture a plant photo via farmctl.py camera-snap.
 
         Args:
             output_path: Filesystem path where the image should be saved.
+            timeout_ms: Camera run time before capture (rpicam-still -t),
+                during which exposure and white balance settle. Defaults
+                to farmctl.py's own default.
 
         Returns:
             The photo path on success, or None on failure.
         """
         args = ["camera-snap", "--out", output_path, "--json"]
+        if timeout_ms is not None:
+            args += ["--timeout-ms", str(timeout_ms)]
 
         if self._dry_run:
-            cmd = f"python3 {self._farmctl_path} {' '.join(args)}"
+            cmd = self._command_prefix + " ".join(args)
             logger.info("[DRY-RUN] Would execute: %s", cmd)
             return output_path
 
@@ -212,10 +251,12 @@ class ActionExecutor:
 
         Args:
             output_path: Filesystem path where the image should be saved.
-            data_dir: If provided, check actuator state and update
-                actuator_state.json after light_on and light_off commands.
-            settle_time: Seconds to wait after light_on for brightness
-                to stabilize.
+            data_dir: If provided, check actuator state and record the
+                light_on / light_off commands in actuator_state.json
+                (one write once the sequence finishes).
+            settle_time: Seconds the light must be on before capture for
+                brightness to stabilize. Overlapped with the camera's own
+                start-up and metering rather than slept through.
             photos_dir: If provided, save a timestamped copy of the photo
                 to this directory for archival.
 
@@ -223,8 +264,7 @@ class ActionExecutor:
             The photo path on success, or None on failure.
         """
         import shutil
-        import time
-        from src.actuator_state import load_actuator_state, update_after_action
+        from src.actuator_state import load_actuator_state, update_after_actions
 
         # --- Check if light is already on ---
         light_already_on = False
@@ -234,12 +274,15 @@ class ActionExecutor:
             if light_already_on:
                 logger.info("Light already on, skipping light toggle for photo")
 
+        # Successful light commands, written to actuator_state.json together
+        state_updates: list[str] = []
+
         # --- Step 1: Turn light on (if needed) ---
         light_on_ok = light_already_on
         if not light_already_on:
             light_on_args = ["light", "on"]
             if self._dry_run:
-                cmd = f"python3 {self._farmctl_path} {' '.join(light_on_args)}"
+                cmd = self._command_prefix + " ".join(light_on_args)
                 logger.info("[DRY-RUN] Would execute: %s", cmd)
                 light_on_ok = True
             else:
@@ -247,33 +290,35 @@ class ActionExecutor:
                 success, msg = self._run_farmctl(light_on_args)
                 light_on_ok = success
                 if success:
-                    if data_dir:
-                        update_after_action("light_on", data_dir)
+                    state_updates.append("light_on")
                 else:
                     logger.warning("light_on failed before photo, continuing: %s", msg)
 
-        # --- Step 2: Wait for light to stabilize (only if we just turned it on) ---
-        if light_on_ok and not light_already_on and not self._dry_run:
-            time.sleep(settle_time)
-
-        # --- Step 3: Take photo ---
-        photo_path = self.take_photo(output_path)
+        # --- Steps 2+3: Let the light stabilize while the camera meters ---
+        # Rather than sleeping, stretch the camera's pre-capture run time
+        # to cover the settle period (only if we just turned the light on).
+        timeout_ms = None
+        if light_on_ok and not light_already_on:
+            timeout_ms = max(CAMERA_TIMEOUT_MS, int(settle_time * 1000))
+        photo_path = self.take_photo(output_path, timeout_ms=timeout_ms)
 
         # --- Step 4: Turn light off (only if we turned it on) ---
         if not light_already_on:
             light_off_args = ["light", "off"]
             if self._dry_run:
-                cmd = f"python3 {self._farmctl_path} {' '.join(light_off_args)}"
+                cmd = self._command_prefix + " ".join(light_off_args)
                 logger.info("[DRY-RUN] Would execute: %s", cmd)
             else:
                 logger.info("Turning light off after photo capture")
                 success, msg = self._run_farmctl(light_off_args)
                 if success:
-                    if data_dir:
-                        update_after_action("light_off", data_dir)
+                    state_updates.append("light_off")
                 else:
                     logger.warning("light_off failed after photo: %s", msg)
 
+        if data_dir and state_updates:
+            update_after_actions(state_updates, data_dir)
+
         # --- Step 5: Archive timestamped copy ---
         if photo_path and photos_dir:
             try:
@@ -296,17 +341,29 @@ class ActionExecutor:
     def _run_farmctl(
         self, args: list[str], timeout: int = 30
     ) -> tuple[bool, str]:
-        """Call farmctl.py with the given arguments via subprocess.
+        """Call farmctl.py with the given arguments.
+
+        Runs the command in-process when farmctl.py can be imported,
+        falling back to a ``python3 farmctl.py`` subprocess otherwise.
 
         Args:
             args: Arguments to pass after ``python3 farmctl.py``.
-            timeout: Maximum seconds to wait before killing the process.
+            timeout: Maximum seconds to wait before killing the process
+                (subprocess only; in-process calls are bounded by the
+                serial and camera timeouts inside farmctl.py).
 
         Returns:
             Tuple of (success, output_or_error). On success the second
             element is stdout; on failure it is a human-readable error
             description.
         """
+        inproc = load_farmctl(self._farmctl_path)
+        if inproc is not None:
+            rc, out, err = inproc.run(args)
+            if rc != 0:
+                return False, f"farmctl.py exited with code {rc}: {err.strip()}"
+            return True, out.strip()
+
         cmd = ["python3", self._farmctl_path] + args
 
         try:
@@ -7,11 +7,14 @@ state is unavailable (mock mode, old firmware, sensor read failure).
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from src.fileutil import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
 STATE_FILE = "actuator_state.json"
@@ -35,6 +38,23 @@ _ACTION_STATE_MAP: dict[str, tuple[str, str]] = {
     "circulation": ("circulation", "idle"),  # fan is timed and self-stops
 }
 
+# Maps hardware-reported SensorData fields to (actuator, (value if false,
+# value if true)), so the state string is values[bool(reading)]. Fields
+# that are None (mock mode, old firmware) are left to the cached file state.
+_HARDWARE_STATE_MAP: tuple[tuple[str, str, tuple[str, str]], ...] = (
+    ("light_on", "light", ("off", "on")),
+    ("heater_on", "heater", ("off", "on")),
+    ("water_pump_on", "pump", ("idle", "running")),
+    ("circulation_on", "circulation", ("idle", "running")),
+    ("water_tank_ok", "water_tank", ("low", "ok")),
+    ("heater_lockout", "heater_lockout", ("normal", "active")),
+)
+
+# Parsed state keyed by file path, validated by (mtime_ns, size). The file
+# is read on every check, chat message and action, so a stat() decides
+# whether it needs re-parsing.
+_STATE_CACHE: dict[Path, tuple[int, int, dict[str, str]]] = {}
+
 
 def load_actuator_state(data_dir: str) -> dict[str, str]:
     """Load the current actuator state from disk, or return defaults.
@@ -42,25 +62,42 @@ def load_actuator_state(data_dir: str) -> dict[str, str]:
     Args:
         data_dir: Path to the data/ directory.
 
+    The parsed file is cached until its mtime or size changes; callers
+    always get their own copy.
+
     Returns:
         Dict with keys: light, heater, pump, circulation, water_tank,
         heater_lockout.
     """
     filepath = Path(data_dir) / STATE_FILE
-    if not filepath.exists():
+    try:
+        st = filepath.stat()
+    except OSError:
+        _STATE_CACHE.pop(filepath, None)
         return dict(DEFAULT_STATE)
 
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _STATE_CACHE.get(filepath)
+    if cached is not None and cached[:2] == key:
+        return dict(cached[2])
+
     try:
-        with open(filepath, "r") as f:
-            state = json.load(f)
+        state = orjson.loads(filepath.read_bytes())
         # Ensure all expected keys are present
-        for key, default in DEFAULT_STATE.items():
-            state.setdefault(key, default)
-        return state
-    except (json.JSONDecodeError, OSError) as exc:
+        for name, default in DEFAULT_STATE.items():
+            state.setdefault(name, default)
+    except FileNotFoundError:
+        # Removed between the stat() and the read
+        _STATE_CACHE.pop(filepath, None)
+        return dict(DEFAULT_STATE)
+    except (orjson.JSONDecodeError, AttributeError, OSError) as exc:
+        _STATE_CACHE.pop(filepath, None)
         logger.warning("Failed to read actuator state, using defaults: %s", exc)
         return dict(DEFAULT_STATE)
 
+    _STATE_CACHE[filepath] = (*key, state)
+    return dict(state)
+
 
 def reconcile_actuator_state(
     sensor_data_dict: dict[str, Any],
@@ -73,7 +110,8 @@ def reconcile_actuator_state(
     unavailable (mock mode, old firmware), the file-based cached state
     is used instead.
 
-    The reconciled state is written back to disk as a cache.
+    The reconciled state is written back to disk as a cache when it
+    differs from what the file already holds.
 
     Args:
         sensor_data_dict: Dict from ``SensorData.to_dict()``.
@@ -84,29 +122,17 @@ def reconcile_actuator_state(
         heater_lockout.
     """
     state = load_actuator_state(data_dir)
+    before = dict(state)
 
     # Override with hardware truth when available
-    if sensor_data_dict.get("light_on") is not None:
-        state["light"] = "on" if sensor_data_dict["light_on"] else "off"
-
-    if sensor_data_dict.get("heater_on") is not None:
-        state["heater"] = "on" if sensor_data_dict["heater_on"] else "off"
-
-    if sensor_data_dict.get("water_pump_on") is not None:
-        state["pump"] = "running" if sensor_data_dict["water_pump_on"] else "idle"
-
-    if sensor_data_dict.get("circulation_on") is not None:
-        state["circulation"] = "running" if sensor_data_dict["circulation_on"] else "idle"
-
-    if sensor_data_dict.get("water_tank_ok") is not None:
-        state["water_tank"] = "ok" if sensor_data_dict["water_tank_ok"] else "low"
-
-    if sensor_data_dict.get("heater_lockout") is not None:
-        state["heater_lockout"] = (
-            "active" if sensor_data_dict["heater_lockout"] else "normal"
-        )
-
-    _save_state(state, data_dir)
+    for field, actuator, values in _HARDWARE_STATE_MAP:
+        value = sensor_data_dict.get(field)
+        if value is not None:
+            state[actuator] = values[bool(value)]
+
+    # Most checks find the relays as they were left; skip the rewrite then
+    if state != before:
+        _save_state(state, data_dir)
     return state
 
 
@@ -117,25 +143,52 @@ def update_after_action(action_name: str, data_dir: str) -> None:
         action_name: The action that was executed (e.g. "light_on", "water").
         data_dir: Path to the data/ directory.
     """
-    mapping = _ACTION_STATE_MAP.get(action_name)
-    if mapping is None:
+    if action_name not in _ACTION_STATE_MAP:
+        return  # do_nothing, notify_human, etc. don't change state
+    update_after_actions([action_name], data_dir)
+
+
+def update_after_actions(action_names: list[str], data_dir: str) -> None:
+    """Apply several successful actions, in order, with a single write.
+
+    Args:
+        action_names: Actions that were executed, oldest first
+            (e.g. ["light_on", "light_off"] around a photo).
+        data_dir: Path to the data/ directory.
+    """
+    changes = [
+        _ACTION_STATE_MAP[name] for name in action_names if name in _ACTION_STATE_MAP
+    ]
+    if not changes:
         return  # do_nothing, notify_human, etc. don't change state
 
-    actuator, new_value = mapping
     state = load_actuator_state(data_dir)
-    state[actuator] = new_value
+    before = dict(state)
+    for actuator, new_value in changes:
+        state[actuator] = new_value
+        logger.debug("Actuator state updated: %s -> %s", actuator, new_value)
 
-    _save_state(state, data_dir)
-    logger.debug("Actuator state updated: %s -> %s", actuator, new_value)
+    # e.g. light_on + light_off around a night photo leaves "off" as it was
+    if state != before:
+        _save_state(state, data_dir)
 
 
 def _save_state(state: dict[str, str], data_dir: str) -> None:
-    """Write state dict to actuator_state.json."""
+    """Write state dict to actuator_state.json.
+
+    Goes through atomic_write_bytes, so a concurrent reader never sees a
+    truncated file and concurrent writers (bot and CLI) never share a
+    temp file.
+    """
     filepath = Path(data_dir) / STATE_FILE
-    filepath.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(filepath, "w") as f:
-            json.dump(state, f, indent=2)
+        atomic_write_bytes(filepath, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        st = filepath.stat()
     except OSError as exc:
+        _STATE_CACHE.pop(filepath, None)
         logger.warning("Failed to write actuator state: %s", exc)
+        return
+
+    # The next load is a stat() hit instead of a re-read of what we wrote
+    _STATE_CACHE[filepath] = (st.st_mtime_ns, st.st_size, dict(state))
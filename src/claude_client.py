@@ -17,10 +17,7 @@ import json
 import logging
 import os
 import time
-from datetime import datetime, timezone
-from typing import Any
-
-import anthropic
+from typing import TYPE_CHECKING, Any
 
 from src.prompts import (
     build_chat_system_prompt,
@@ -30,6 +27,9 @@ from src.prompts import (
     build_user_prompt,
 )
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -42,9 +42,15 @@ MAX_RESEARCH_TOKENS = 4096
 MAX_RETRIES = 3
 RETRY_BASE_DELAY_SEC = 2.0  # exponential backoff: 2s, 4s, 8s
 
+# Keys every plant decision must contain; missing ones are filled with
+# conservative defaults by get_plant_decision().
+_REQUIRED_DECISION_KEYS = frozenset({"assessment", "actions", "urgency", "notify_human"})
+
 # Approximate pricing per 1M tokens (Sonnet). Used for cost estimation only.
 _INPUT_COST_PER_M = 3.0   # USD per 1M input tokens
 _OUTPUT_COST_PER_M = 15.0  # USD per 1M output tokens
+_INPUT_COST_PER_TOKEN = _INPUT_COST_PER_M / 1_000_000
+_OUTPUT_COST_PER_TOKEN = _OUTPUT_COST_PER_M / 1_000_000
 
 
 # ---------------------------------------------------------------------------
@@ -57,19 +63,18 @@ class TokenUsageTracker:
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
         self.call_count: int = 0
+        # Rough cost estimate based on public Sonnet pricing, kept as a
+        # running total since it is logged after every call.
+        self.estimated_cost_usd: float = 0.0
 
     def record(self, input_tokens: int, output_tokens: int) -> None:
         """Record token usage from a single API call."""
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
         self.call_count += 1
-
-    @property
-    def estimated_cost_usd(self) -> float:
-        """Rough cost estimate based on public Sonnet pricing."""
-        input_cost = (self.total_input_tokens / 1_000_000) * _INPUT_COST_PER_M
-        output_cost = (self.total_output_tokens / 1_000_000) * _OUTPUT_COST_PER_M
-        return input_cost + output_cost
+        self.estimated_cost_usd += (
+            input_tokens * _INPUT_COST_PER_TOKEN + output_tokens * _OUTPUT_COST_PER_TOKEN
+        )
 
     def summary(self) -> dict[str, Any]:
         """Return a summary dict suitable for logging."""
@@ -89,19 +94,31 @@ usage_tracker = TokenUsageTracker()
 # Client helpers
 # ---------------------------------------------------------------------------
 
+# Anthropic client reused across calls, keyed by API key so a changed key
+# gets a fresh client. The anthropic package (httpx, pydantic) takes over a
+# second to import on a Pi, so it is only imported once a call is made.
+_client: tuple[str, Any] | None = None
+
+
 def _get_client() -> anthropic.Anthropic:
-    """Create an Anthropic client using the API key from the environment.
+    """Return an Anthropic client using the API key from the environment.
 
     Raises:
         ValueError: If ANTHROPIC_API_KEY is not set.
     """
+    global _client
+
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError(
             "ANTHROPIC_API_KEY environment variable is not set. "
             "Set it in your .env file or export it in your shell."
         )
-    return anthropic.Anthropic(api_key=api_key)
+    if _client is None or _client[0] != api_key:
+        import anthropic
+
+        _client = (api_key, anthropic.Anthropic(api_key=api_key))
+    return _client[1]
 
 
 def _get_model() -> str:
@@ -135,6 +152,8 @@ def _call_with_retry(
     Raises:
         The last exception if all retries are exhausted.
     """
+    import anthropic
+
     last_exc: Exception | None = None
 
     for attempt in range(max_retries + 1):
@@ -168,6 +187,11 @@ def _call_with_retry(
     raise last_exc  # type: ignore[misc]
 
 
+# Shared decoder for _extract_json(); raw_decode() parses one value at an
+# offset and ignores whatever follows it.
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _extract_json(text: str) -> dict[str, Any]:
     """Extract a JSON object from Claude's response text.
 
@@ -185,33 +209,30 @@ def _extract_json(text: str) -> dict[str, Any]:
     """
     cleaned = text.strip()
 
-    # Strip markdown code fences if present
+    # Skip an opening markdown fence (with optional language tag); a
+    # closing fence is trailing text that raw_decode() stops before.
     if cleaned.startswith("```"):
-        # Remove opening fence (with optional language tag)
-        first_newline = cleaned.index("\n") if "\n" in cleaned else len(cleaned)
-        cleaned = cleaned[first_newline + 1:]
-        # Remove closing fence
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3].strip()
-
+        first_newline = cleaned.find("\n")
+        cleaned = cleaned[first_newline + 1:] if first_newline != -1 else ""
+
+    # Decode the object starting at the first "{", ignoring any prose
+    # before or after it. Only that brace is tried: if the reply was cut
+    # off, a later "{" would be a nested object (e.g. a single action),
+    # which must not be mistaken for the whole response.
+    start = cleaned.find("{")
+    if start == -1:
+        raise ValueError(
+            "Failed to parse JSON from Claude response: no JSON object found. "
+            f"Raw text (first 500 chars): {text[:500]}"
+        )
     try:
-        result = json.loads(cleaned)
-        if isinstance(result, dict):
-            return result
-        raise ValueError(f"Expected JSON object, got {type(result).__name__}")
+        result, _ = _JSON_DECODER.raw_decode(cleaned, start)
     except json.JSONDecodeError as exc:
-        # Last resort: try to find a JSON object in the text
-        start = cleaned.find("{")
-        end = cleaned.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            try:
-                return json.loads(cleaned[start : end + 1])
-            except json.JSONDecodeError:
-                pass
         raise ValueError(
             f"Failed to parse JSON from Claude response: {exc}. "
             f"Raw text (first 500 chars): {text[:500]}"
         ) from exc
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -256,7 +277,7 @@ def get_plant_decision(
     client = _get_client()
     model = _get_model()
 
-    current_time = datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S %Z")
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S %Z")
 
     light_hours = plant_profile.get("ideal_conditions", {}).get("light_hours", 14)
     schedule_on = (light_schedule or {}).get("schedule_on", "06:00")
@@ -293,8 +314,8 @@ def get_plant_decision(
     response = _call_with_retry(_api_call)
 
     # Track token usage
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
+    usage = response.usage
+    input_tokens, output_tokens = usage.input_tokens, usage.output_tokens
     usage_tracker.record(input_tokens, output_tokens)
 
     logger.info(
@@ -305,10 +326,7 @@ def get_plant_decision(
     )
 
     # Extract text from response
-    raw_text = ""
-    for block in response.content:
-        if block.type == "text":
-            raw_text += block.text
+    raw_text = "".join(block.text for block in response.content if block.type == "text")
 
     if not raw_text.strip():
         raise ValueError("Claude returned an empty response.")
@@ -326,8 +344,7 @@ def get_plant_decision(
         ]
 
     # Validate required keys are present
-    required_keys = {"assessment", "actions", "urgency", "notify_human"}
-    missing = required_keys - set(decision.keys())
+    missing = _REQUIRED_DECISION_KEYS.difference(decision)
     if missing:
         logger.warning(
             "Decision missing expected keys: %s. Raw: %s",
@@ -392,7 +409,7 @@ def get_chat_response(
     client = _get_client()
     model = _get_model()
 
-    current_time = datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S %Z")
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S %Z")
 
     system_prompt = build_chat_system_prompt(plant_profile, plant_knowledge, hardware_profile)
     user_content = build_chat_user_prompt(
@@ -418,8 +435,8 @@ def get_chat_response(
     response = _call_with_retry(_api_call)
 
     # Track token usage
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
+    usage = response.usage
+    input_tokens, output_tokens = usage.input_tokens, usage.output_tokens
     usage_tracker.record(input_tokens, output_tokens)
 
     logger.info(
@@ -430,10 +447,7 @@ def get_chat_response(
     )
 
     # Extract text from response
-    raw_text = ""
-    for block in response.content:
-        if block.type == "text":
-            raw_text += block.text
+    raw_text = "".join(block.text for block in response.content if block.type == "text")
 
     if not raw_text.strip():
         raise ValueError("Claude returned an empty chat response.")
@@ -503,8 +517,8 @@ def research_plant(
     response = _call_with_retry(_api_call)
 
     # Track token usage
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
+    usage = response.usage
+    input_tokens, output_tokens = usage.input_tokens, usage.output_tokens
     usage_tracker.record(input_tokens, output_tokens)
 
     logger.info(
@@ -530,7 +544,7 @@ def research_plant(
     header = (
         f"# Growing Guide: {plant_name}{variety_label}\n\n"
         f"*Growth stage: {growth_stage}*  \n"
-        f"*Researched: {datetime.now().astimezone().strftime('%Y-%m-%d %H:%M %Z')}*\n\n"
+        f"*Researched: {time.strftime('%Y-%m-%d %H:%M %Z')}*\n\n"
         "---\n\n"
     )
 
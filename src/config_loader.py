@@ -6,16 +6,34 @@ All paths resolve relative to the project root.
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from src.fileutil import atomic_write_bytes
+
+# libyaml-backed loader/dumper when PyYAML was built with it (the Pi's
+# python3-yaml package is); same safe subset, several times faster.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 # Project root: two levels up from this file (src/config_loader.py -> plant-ops-ai/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = PROJECT_ROOT / "config"
 
+# Parsed config files keyed by path, validated by (mtime_ns, size). The
+# profiles and safety limits are read on every check, chat message and
+# action validation but rarely change, so a stat() is enough to decide
+# whether to re-parse.
+_YAML_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
 
 def load_yaml(path: str | Path) -> dict[str, Any]:
     """Load a YAML file and return its contents as a dict.
@@ -34,41 +52,77 @@ def load_yaml(path: str | Path) -> dict[str, Any]:
     if not filepath.is_absolute():
         filepath = PROJECT_ROOT / filepath
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"Config file not found: {filepath}")
+    # One read instead of exists() + a buffered text stream; libyaml
+    # detects the encoding from the bytes itself.
+    try:
+        raw = filepath.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {filepath}") from None
 
-    with open(filepath, "r") as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(raw, Loader=_SafeLoader)
 
-    # safe_load returns None for empty files
+    # The loader returns None for empty files
     return data if data is not None else {}
 
 
+def _load_cached(filepath: Path) -> dict[str, Any]:
+    """Load a config file through _YAML_CACHE, returning a deep copy."""
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        _YAML_CACHE.pop(filepath, None)
+        raise FileNotFoundError(f"Config file not found: {filepath}") from None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(filepath)
+    if cached is None or cached[:2] != key:
+        cached = _YAML_CACHE[filepath] = (*key, load_yaml(filepath))
+    return copy.deepcopy(cached[2])
+
+
 def load_safety_limits() -> dict[str, Any]:
     """Load config/safety_limits.yaml.
 
+    Cached until the file's mtime or size changes, like the profiles.
+
     Returns:
         Safety limits configuration dict.
     """
-    return load_yaml(CONFIG_DIR / "safety_limits.yaml")
+    return _load_cached(CONFIG_DIR / "safety_limits.yaml")
 
 
 def load_plant_profile() -> dict[str, Any]:
     """Load config/plant_profile.yaml.
 
+    The parsed profile is cached until the file's mtime or size changes.
+    Callers receive a deep copy and may mutate it freely.
+
     Returns:
         Plant profile configuration dict.
     """
-    return load_yaml(CONFIG_DIR / "plant_profile.yaml")
+    return _load_cached(CONFIG_DIR / "plant_profile.yaml")
 
 
 def load_hardware_profile() -> dict[str, Any]:
     """Load config/hardware_profile.yaml.
 
+    Cached until the file's mtime or size changes, like the plant profile.
+
     Returns:
         Hardware profile configuration dict.
     """
-    return load_yaml(CONFIG_DIR / "hardware_profile.yaml")
+    return _load_cached(CONFIG_DIR / "hardware_profile.yaml")
+
+
+def _save_yaml(filepath: Path, data: dict[str, Any]) -> None:
+    """Write *data* to a config file and drop its cache entry.
+
+    Goes through atomic_write_bytes, so a reader (or a crash mid-write)
+    never leaves a truncated config behind and the file keeps its mode.
+    """
+    text = yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+    atomic_write_bytes(filepath, text.encode("utf-8"))
+    _YAML_CACHE.pop(filepath, None)
 
 
 def save_plant_profile(profile: dict[str, Any]) -> None:
@@ -77,11 +131,7 @@ def save_plant_profile(profile: dict[str, Any]) -> None:
     Args:
         profile: Plant profile dict to save.
     """
-    filepath = CONFIG_DIR / "plant_profile.yaml"
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filepath, "w") as f:
-        yaml.dump(profile, f, default_flow_style=False, sort_keys=False)
+    _save_yaml(CONFIG_DIR / "plant_profile.yaml", profile)
 
 
 def save_hardware_profile(profile: dict[str, Any]) -> None:
@@ -90,8 +140,4 @@ def save_hardware_profile(profile: dict[str, Any]) -> None:
     Args:
         profile: Hardware profile dict to save.
     """
-    filepath = CONFIG_DIR / "hardware_profile.yaml"
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filepath, "w") as f:
-        yaml.dump(profile, f, default_flow_style=False, sort_keys=False)
+    _save_yaml(CONFIG_DIR / "hardware_profile.yaml", profile)
@@ -0,0 +1,114 @@
+"""In-process farmctl.py execution for plant-ops-ai.
+
+Loads farmctl.py as a module so the bot process can run its commands
+without spawning ``python3 farmctl.py`` each time. One SerialClient per
+script path is shared by every caller (actions, photos, sensor reads),
+so a burst of commands reuses one port open. The port is opened
+exclusively and closed after PORT_IDLE_CLOSE_S without commands, so a
+``python3 farmctl.py`` run from the shell can take it in between.
+
+Callers fall back to subprocess when load_farmctl() returns None.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Seconds without a command before the shared serial port is released.
+PORT_IDLE_CLOSE_S = 5.0
+
+
+@dataclass
+class InProcessFarmctl:
+    """farmctl.py loaded as a module, plus its shared serial connection."""
+
+    module: Any
+    serial_client: Any
+    # The Arduino handles one command at a time; serialize callers across
+    # threads (scheduled check vs. manual commands vs. /status).
+    lock: threading.Lock
+    # Pending idle close of the serial port; replaced by every run().
+    _idle_timer: threading.Timer | None = field(default=None, init=False, repr=False)
+
+    def run(self, args: list[str]) -> tuple[int, str, str]:
+        """Run one farmctl command; returns (exit_code, stdout, stderr)."""
+        try:
+            with self.lock:
+                if self._idle_timer is not None:
+                    self._idle_timer.cancel()
+                try:
+                    return self.module.execute(args, sc=self.serial_client)
+                finally:
+                    self._idle_timer = threading.Timer(PORT_IDLE_CLOSE_S, self._close_if_idle)
+                    self._idle_timer.daemon = True
+                    self._idle_timer.start()
+        except SystemExit as exc:
+            # Mirror the exit status the CLI would have had
+            if exc.code is None or exc.code == 0:
+                return 0, "", ""
+            if exc.code == 2:  # argparse rejected the arguments
+                return 2, "", "invalid arguments"
+            if isinstance(exc.code, int):
+                return exc.code, "", ""
+            return 1, "", str(exc.code)
+        except Exception as exc:
+            logger.error("farmctl.py failed in-process: %s", exc)
+            return 1, "", f"ERROR: {exc}"
+
+    def _close_if_idle(self) -> None:
+        """Release the serial port unless a newer run() rescheduled us."""
+        with self.lock:
+            if self._idle_timer is not threading.current_thread():
+                return
+            self._idle_timer = None
+            try:
+                self.serial_client.close()
+            except Exception as exc:
+                logger.warning("Failed to close idle serial port: %s", exc)
+
+
+# Loaded farmctl modules keyed by script path. None records a path that
+# can't run in-process, so callers go straight to subprocess next time.
+_LOADED: dict[str, InProcessFarmctl | None] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def load_farmctl(farmctl_path: str) -> InProcessFarmctl | None:
+    """Import farmctl.py from *farmctl_path* for in-process execution.
+
+    Returns None (cached) if the script can't be imported or pyserial is
+    not available in this interpreter.
+    """
+    with _LOADED_LOCK:
+        if farmctl_path in _LOADED:
+            return _LOADED[farmctl_path]
+
+        loaded = None
+        name = f"_farmctl_{len(_LOADED)}"
+        try:
+            spec = importlib.util.spec_from_file_location(name, farmctl_path)
+            module = importlib.util.module_from_spec(spec)
+            # dataclasses looks the module up in sys.modules while executing
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            if getattr(module, "serial", None) is None:
+                logger.info("pyserial not importable; farmctl.py runs via subprocess")
+            else:
+                loaded = InProcessFarmctl(
+                    module=module,
+                    serial_client=module.SerialClient(),
+                    lock=threading.Lock(),
+                )
+        except Exception as exc:
+            sys.modules.pop(name, None)
+            logger.info("farmctl.py not importable (%s); using subprocess", exc)
+
+        _LOADED[farmctl_path] = loaded
+        return loaded
@@ -0,0 +1,61 @@
+"""Atomic file writes for plant-ops-ai.
+
+State and config files are rewritten by both the bot and the CLI, so
+every save goes through a uniquely named sibling temp file that is
+renamed over the target.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+from pathlib import Path
+
+# Attempts at a fresh temp file name before giving up (tempfile's TMP_MAX).
+_TEMP_ATTEMPTS = 10000
+
+
+def _create_temp(filepath: Path) -> tuple[int, Path]:
+    """Create and open a uniquely named temp file next to *filepath*.
+
+    Created with mode 0o666 so the kernel applies the process umask, as
+    for any other new file; tempfile would force 0600 instead.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    for _ in range(_TEMP_ATTEMPTS):
+        tmp_path = filepath.with_name(f"{filepath.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(errno.EEXIST, "No usable temporary file name found", str(filepath))
+
+
+def atomic_write_bytes(filepath: Path, data: bytes) -> None:
+    """Write *data* to *filepath* through a sibling temp file and rename.
+
+    A reader (or a crash mid-write) never sees a truncated file, and
+    concurrent writers never share a temp file. The result keeps the
+    target's existing permissions, or the umask default for a new file.
+
+    Raises:
+        OSError: If the temp file cannot be written or renamed.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode: int | None = filepath.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_path = _create_temp(filepath)
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
@@ -4,11 +4,20 @@ Append-only logging of sensor readings and AI decisions.
 Each log file uses JSONL format (one JSON object per line).
 """
 
-import json
+from __future__ import annotations
+
+import atexit
+import copy
 import logging
+import os
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+import orjson
 
 from src.sensor_reader import SensorData
 
@@ -18,6 +27,27 @@ SENSOR_FILE = "sensor_history.jsonl"
 DECISION_FILE = "decisions.jsonl"
 PLANT_LOG_FILE = "plant_log.jsonl"
 
+# Open append handles for the JSONL logs, keyed by file path. Sensor
+# readings and decisions are logged on every scheduled check and manual
+# command, so handles are kept open instead of paying open/close (and a
+# mkdir) per record. _APPEND_LOCK guards the lookup, reopen and write:
+# the scheduler and bot handlers log from several worker threads.
+_APPEND_HANDLES: dict[Path, IO[bytes]] = {}
+_APPEND_LOCK = threading.Lock()
+
+# recent_records() results keyed by (path, n) -> (mtime_ns, size, records).
+# Guarded by _RECENT_LOCK: several to_thread workers read logs at once.
+_RECENT_CACHE: dict[tuple[Path, int], tuple[int, int, list[dict[str, Any]]]] = {}
+_RECENT_CACHE_MAX = 32
+_RECENT_LOCK = threading.Lock()
+
+# _tail_jsonl() reads the end of a log file backwards in blocks this size.
+_TAIL_CHUNK_BYTES = 8192
+
+# orjson writes the trailing newline itself; non-str keys are stringified
+# as the stdlib json module would.
+_DUMPS_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
 
 def _ensure_dir(data_dir: str) -> Path:
     """Create the data directory if it doesn't exist.
@@ -33,6 +63,42 @@ def _ensure_dir(data_dir: str) -> Path:
     return path
 
 
+def _append_handle(filepath: Path) -> IO[bytes]:
+    """Return a cached, unbuffered binary append handle for *filepath*.
+
+    Each record goes out in a single write with no userspace buffering, so
+    readers (e.g. the safety layer's rate limits) always see the latest
+    records. Records are written as they are logged rather than batched
+    for the same reason. If the file was deleted since the handle was
+    opened, it is reopened; the parent directory is created on open.
+    The caller must hold _APPEND_LOCK until it has finished writing.
+
+    Args:
+        filepath: Path to the JSONL file.
+
+    Returns:
+        Open binary file handle in append mode.
+    """
+    fh = _APPEND_HANDLES.get(filepath)
+    if fh is not None:
+        if os.fstat(fh.fileno()).st_nlink > 0:
+            return fh
+        fh.close()
+
+    _ensure_dir(str(filepath.parent))
+    fh = open(filepath, "ab", buffering=0)
+    _APPEND_HANDLES[filepath] = fh
+    return fh
+
+
+@atexit.register
+def _close_append_handles() -> None:
+    with _APPEND_LOCK:
+        for fh in _APPEND_HANDLES.values():
+            fh.close()
+        _APPEND_HANDLES.clear()
+
+
 def _append_jsonl(filepath: Path, record: dict[str, Any]) -> None:
     """Append a single JSON record to a JSONL file.
 
@@ -40,40 +106,126 @@ def _append_jsonl(filepath: Path, record: dict[str, Any]) -> None:
         filepath: Path to the JSONL file.
         record: Dict to serialize as one JSON line.
     """
-    line = json.dumps(record, default=str)
-    with open(filepath, "a") as f:
-        f.write(line + "\n")
+    payload = orjson.dumps(record, default=str, option=_DUMPS_OPTS)
+    with _APPEND_LOCK:
+        _append_handle(filepath).write(payload)
+
 
+def _append_jsonl_many(filepath: Path, records: list[dict[str, Any]]) -> None:
+    """Append several JSON records to a JSONL file with a single write.
 
-def _read_jsonl(filepath: Path) -> list[dict[str, Any]]:
-    """Read all records from a JSONL file.
+    Args:
+        filepath: Path to the JSONL file.
+        records: Dicts to serialize, one JSON line each.
+    """
+    if not records:
+        return
+    payload = b"".join(
+        orjson.dumps(record, default=str, option=_DUMPS_OPTS) for record in records
+    )
+    with _APPEND_LOCK:
+        _append_handle(filepath).write(payload)
 
-    Skips blank lines and lines that fail to parse (logs a warning).
+
+def _iter_jsonl_reversed(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSONL file newest first.
+
+    Reads backwards from the end of the file in _TAIL_CHUNK_BYTES blocks,
+    so a caller that stops early only pays for the records it consumed,
+    not for the whole history. Skips blank lines and logs a warning for
+    lines that fail to parse. A missing file yields nothing.
 
     Args:
         filepath: Path to the JSONL file.
 
+    Yields:
+        Parsed dicts, from the last line of the file to the first.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        return
+
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""  # start of the earliest line read so far
+        while pos > 0:
+            size = min(_TAIL_CHUNK_BYTES, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b"\n")
+            # The first piece may continue in the block before this one
+            partial = lines.pop(0) if pos > 0 else b""
+            for line in reversed(lines):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping malformed JSONL line in %s", filepath)
+                    continue
+                yield record
+
+
+def _tail_jsonl(filepath: Path, n: int) -> list[dict[str, Any]]:
+    """Read the last *n* records from a JSONL file.
+
+    Stops reading once *n* records are parsed, so the cost depends on *n*
+    rather than on how long the history has grown.
+
+    Args:
+        filepath: Path to the JSONL file.
+        n: Number of records to return.
+
     Returns:
-        List of parsed dicts.
+        List of up to *n* parsed dicts (oldest first).
     """
-    if not filepath.exists():
+    if n <= 0:
         return []
-
-    records = []
-    with open(filepath, "r") as f:
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Skipping malformed JSONL line %d in %s", line_num, filepath
-                )
+    records = list(islice(_iter_jsonl_reversed(filepath), n))
+    records.reverse()
     return records
 
 
+def recent_records(filepath: Path, n: int) -> list[dict[str, Any]]:
+    """Return the last *n* records of a JSONL log, cached per (path, n).
+
+    Entries are validated with a single stat() against the file's mtime
+    and size, so repeated reads between appends (every check, chat
+    message and /history tap) skip the file entirely, while an append
+    from any process (bot or CLI) invalidates them. Callers get a deep
+    copy, so mutating the result never touches the cache.
+
+    Args:
+        filepath: Path to the JSONL file.
+        n: Number of records to return.
+
+    Returns:
+        List of up to *n* parsed dicts (oldest first).
+    """
+    if n <= 0:
+        return []
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return []
+
+    key = (filepath, n)
+    with _RECENT_LOCK:
+        cached = _RECENT_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+
+    records = _tail_jsonl(filepath, n)
+    with _RECENT_LOCK:
+        if key not in _RECENT_CACHE and len(_RECENT_CACHE) >= _RECENT_CACHE_MAX:
+            # FIFO eviction: dicts preserve insertion order
+            del _RECENT_CACHE[next(iter(_RECENT_CACHE))]
+        _RECENT_CACHE[key] = (st.st_mtime_ns, st.st_size, records)
+    return copy.deepcopy(records)
+
+
 def log_plant_observations(
     observations: list[str], data_dir: str, source: str = "scheduled_check"
 ) -> None:
@@ -87,13 +239,13 @@ def log_plant_observations(
     if not observations:
         return
 
-    dirpath = _ensure_dir(data_dir)
-    filepath = dirpath / PLANT_LOG_FILE
+    filepath = Path(data_dir) / PLANT_LOG_FILE
     ts = datetime.now().astimezone().isoformat()
 
-    for obs in observations:
-        record = {"timestamp": ts, "observation": obs, "source": source}
-        _append_jsonl(filepath, record)
+    _append_jsonl_many(
+        filepath,
+        [{"timestamp": ts, "observation": obs, "source": source} for obs in observations],
+    )
 
 
 def load_recent_plant_log(n: int, data_dir: str) -> list[dict[str, Any]]:
@@ -106,23 +258,24 @@ def load_recent_plant_log(n: int, data_dir: str) -> list[dict[str, Any]]:
     Returns:
         List of the most recent N plant log dicts (newest last).
     """
-    filepath = Path(data_dir) / PLANT_LOG_FILE
-    records = _read_jsonl(filepath)
-    return records[-n:] if n > 0 else []
+    return recent_records(Path(data_dir) / PLANT_LOG_FILE, n)
 
 
-def log_sensor_reading(data: SensorData, data_dir: str) -> None:
+def log_sensor_reading(
+    data: SensorData, data_dir: str, timestamp: str | None = None
+) -> None:
     """Append a sensor reading to sensor_history.jsonl.
 
     Args:
         data: Current sensor readings.
         data_dir: Path to the data directory.
+        timestamp: ISO timestamp for ``logged_at``. Defaults to now; pass
+            one explicitly to reuse a timestamp the caller already has.
     """
-    dirpath = _ensure_dir(data_dir)
     record = data.to_dict()
-    record["logged_at"] = datetime.now().astimezone().isoformat()
+    record["logged_at"] = timestamp or datetime.now().astimezone().isoformat()
 
-    _append_jsonl(dirpath / SENSOR_FILE, record)
+    _append_jsonl(Path(data_dir) / SENSOR_FILE, record)
 
 
 def log_decision(
@@ -132,6 +285,7 @@ def log_decision(
     executed: bool,
     data_dir: str,
     source: str = "scheduled",
+    timestamp: str | None = None,
 ) -> None:
     """Append a decision record to decisions.jsonl.
 
@@ -142,11 +296,11 @@ def log_decision(
         executed: Whether the action was actually executed.
         data_dir: Path to the data directory.
         source: Origin of the decision (e.g. "scheduled", "manual_command").
+        timestamp: ISO timestamp for the record. Defaults to now; pass one
+            explicitly to share it across all actions of a decision.
     """
-    dirpath = _ensure_dir(data_dir)
-
     record = {
-        "timestamp": datetime.now().astimezone().isoformat(),
+        "timestamp": timestamp or datetime.now().astimezone().isoformat(),
         "source": source,
         "sensor_data": sensor_data.to_dict(),
         "decision": decision,
@@ -158,7 +312,7 @@ def log_decision(
         "executed": executed,
     }
 
-    _append_jsonl(dirpath / DECISION_FILE, record)
+    _append_jsonl(Path(data_dir) / DECISION_FILE, record)
 
 
 def load_recent_decisions(n: int, data_dir: str) -> list[dict[str, Any]]:
@@ -171,9 +325,7 @@ def load_recent_decisions(n: int, data_dir: str) -> list[dict[str, Any]]:
     Returns:
         List of the most recent N decision dicts (newest last).
     """
-    filepath = Path(data_dir) / DECISION_FILE
-    records = _read_jsonl(filepath)
-    return records[-n:] if n > 0 else []
+    return recent_records(Path(data_dir) / DECISION_FILE, n)
 
 
 def load_recent_sensors(n: int, data_dir: str) -> list[dict[str, Any]]:
@@ -186,34 +338,36 @@ def load_recent_sensors(n: int, data_dir: str) -> list[dict[str, Any]]:
     Returns:
         List of the most recent N sensor reading dicts (newest last).
     """
-    filepath = Path(data_dir) / SENSOR_FILE
-    records = _read_jsonl(filepath)
-    return records[-n:] if n > 0 else []
+    return recent_records(Path(data_dir) / SENSOR_FILE, n)
 
 
 def get_daily_action_counts(data_dir: str) -> dict[str, int]:
-    """Count actions by type for today (UTC).
+    """Count executed actions by type for today (local time).
 
     Args:
         data_dir: Path to the data directory.
 
     Returns:
-        Dict mapping action type strings to their count today.
+        Dict mapping action type strings to their count since local
+        midnight (timestamps are logged with the local UTC offset).
         Example: {"water": 3, "light": 1, "do_nothing": 5}
     """
     filepath = Path(data_dir) / DECISION_FILE
-    records = _read_jsonl(filepath)
 
     today = datetime.now().astimezone().date().isoformat()
     counts: dict[str, int] = {}
 
-    for record in records:
-        # Only count executed actions
-        if not record.get("executed", False):
-            continue
-
+    # Decisions are appended in time order, so walk back from the end of
+    # the file and stop at the first record from an earlier day.
+    for record in _iter_jsonl_reversed(filepath):
         ts = record.get("timestamp", "")
         if not ts.startswith(today):
+            if ts and ts[:10] < today:
+                break
+            continue
+
+        # Only count executed actions
+        if not record.get("executed", False):
             continue
 
         action_type = record.get("decision", {}).get("action", "unknown")
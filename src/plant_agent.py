@@ -20,6 +20,8 @@ import json
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -44,6 +46,14 @@ from src.weather import fetch_weather
 
 logger = logging.getLogger(__name__)
 
+# Serializes validate -> execute -> log across the scheduler thread and
+# manual Telegram confirmations, so each safety check sees the actions
+# the other path has already logged.
+_ACTION_LOCK = threading.Lock()
+
+# Number of recent decisions fed to the safety rate-limit checks.
+_SAFETY_HISTORY_N = 20
+
 # Offline fallback rules - applied when Claude API is unreachable.
 # These are intentionally simple and conservative.
 FALLBACK_RULES = {
@@ -128,25 +138,31 @@ def run_check(
         return summary
 
     summary["sensor_data"] = sensor_data.to_dict()
-    log_sensor_reading(sensor_data, data_dir)
+    # The check's own timestamp was taken just before the sensor read
+    log_sensor_reading(sensor_data, data_dir, timestamp=summary["timestamp"])
+
+    # --- 1b + 2. Fetch outdoor weather while capturing the photo ---
+    # The weather request waits on the network and the photo on the
+    # camera, so overlap them. Sensors were read above, before the light
+    # goes on for the photo, so the reading isn't skewed by it.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        weather_future = pool.submit(fetch_weather)  # optional, never raises
+
+        photo_path = None
+        if include_photo and not use_mock:
+            photo_executor = ActionExecutor(farmctl_path, dry_run=False)
+            photo_path = photo_executor.take_photo_with_light(
+                output_path=os.path.join(data_dir, "plant_latest.jpg"),
+                data_dir=data_dir if not dry_run else None,
+                photos_dir=os.path.join(data_dir, "photos"),
+            )
+            if photo_path:
+                logger.info("Photo captured: %s", photo_path)
+            else:
+                logger.warning("Photo capture failed, continuing without photo")
 
-    # --- 1b. Fetch outdoor weather (optional, non-blocking) ---
-    weather_data = fetch_weather()
+        weather_data = weather_future.result()
     summary["weather_data"] = weather_data
-
-    # --- 2. Optionally capture photo (with light) ---
-    photo_path = None
-    if include_photo and not use_mock:
-        photo_executor = ActionExecutor(farmctl_path, dry_run=False)
-        photo_path = photo_executor.take_photo_with_light(
-            output_path=os.path.join(data_dir, "plant_latest.jpg"),
-            data_dir=data_dir if not dry_run else None,
-            photos_dir=os.path.join(data_dir, "photos"),
-        )
-        if photo_path:
-            logger.info("Photo captured: %s", photo_path)
-        else:
-            logger.warning("Photo capture failed, continuing without photo")
     summary["photo_path"] = photo_path
 
     # --- 3. Load context ---
@@ -214,7 +230,7 @@ def run_check(
         actions=decision.get("actions", []),
         decision_context=decision_context,
         sensor_data=sensor_data,
-        history=history,
+        history=None,
         executor=executor,
         data_dir=data_dir,
         dry_run=dry_run,
@@ -247,7 +263,7 @@ def execute_validated_actions(
     actions: list[dict[str, Any]],
     decision_context: dict[str, Any],
     sensor_data: SensorData,
-    history: list[dict[str, Any]],
+    history: list[dict[str, Any]] | None,
     executor: ActionExecutor,
     data_dir: str,
     dry_run: bool,
@@ -256,14 +272,18 @@ def execute_validated_actions(
     """Validate, execute, and log a list of actions.
 
     This is the canonical action execution pipeline used by both the
-    scheduler and manual Telegram slash commands.
+    scheduler and manual Telegram slash commands. The whole pipeline runs
+    under a module-level lock, so concurrent callers cannot both pass the
+    rate limits before either has logged its action.
 
     Args:
         actions: List of action dicts, each with keys: action, params, reason.
         decision_context: Top-level decision metadata with keys:
             urgency, notify_human, assessment, notes.
         sensor_data: Current SensorData (required for safety validation).
-        history: Recent decision history (required for rate limit checks).
+        history: Recent decision history for the rate limit checks. If None,
+            recent decisions are re-read from data_dir under the lock before
+            each action, so concurrent callers see each other's actions.
         executor: Pre-configured ActionExecutor instance.
         data_dir: Path to data directory for logging.
         dry_run: Whether this is a dry-run execution.
@@ -275,52 +295,61 @@ def execute_validated_actions(
     """
     actions_taken: list[dict] = []
 
-    for act in actions:
-        single = {
-            "action": act.get("action", "do_nothing"),
-            "params": act.get("params", {}),
-            "reason": act.get("reason", ""),
-            "urgency": decision_context.get("urgency", "normal"),
-            "notify_human": decision_context.get("notify_human", False),
-            "assessment": decision_context.get("assessment", ""),
-            "notes": decision_context.get("notes", ""),
-        }
-
-        validation = validate_action(single, sensor_data, history)
-
-        if not validation.valid:
-            logger.warning("Safety rejected action %s: %s",
-                           single["action"], validation.reason)
-            log_decision(sensor_data, single, validation,
-                         executed=False, data_dir=data_dir, source=source)
-            actions_taken.append({
-                "action": single["action"],
-                "executed": False,
-                "safety_reason": validation.reason,
-            })
-            continue
-
-        final_action = validation.capped_action or single
+    with _ACTION_LOCK:
+        # All actions from one decision share a single log timestamp, taken
+        # under the lock so the log stays in time order across callers.
+        logged_at = datetime.now().astimezone().isoformat()
+
+        for act in actions:
+            single = {
+                "action": act.get("action", "do_nothing"),
+                "params": act.get("params", {}),
+                "reason": act.get("reason", ""),
+                "urgency": decision_context.get("urgency", "normal"),
+                "notify_human": decision_context.get("notify_human", False),
+                "assessment": decision_context.get("assessment", ""),
+                "notes": decision_context.get("notes", ""),
+            }
 
-        executed = False
-        if final_action.get("action") not in ("do_nothing", "notify_human"):
-            result = executor.execute(final_action)
-            executed = result.success
-            if not result.success:
-                logger.error("Action execution failed: %s", result.error)
+            recent = (history if history is not None
+                      else load_recent_decisions(_SAFETY_HISTORY_N, data_dir))
+            validation = validate_action(single, sensor_data, recent)
+
+            if not validation.valid:
+                logger.warning("Safety rejected action %s: %s",
+                               single["action"], validation.reason)
+                log_decision(sensor_data, single, validation,
+                             executed=False, data_dir=data_dir, source=source,
+                             timestamp=logged_at)
+                actions_taken.append({
+                    "action": single["action"],
+                    "executed": False,
+                    "safety_reason": validation.reason,
+                })
+                continue
+
+            final_action = validation.capped_action or single
+
+            executed = False
+            if final_action.get("action") not in ("do_nothing", "notify_human"):
+                result = executor.execute(final_action)
+                executed = result.success
+                if not result.success:
+                    logger.error("Action execution failed: %s", result.error)
+                else:
+                    logger.info("Action executed: %s", result.command)
+                    if not dry_run:
+                        update_after_action(final_action["action"], data_dir)
             else:
-                logger.info("Action executed: %s", result.command)
-                if not dry_run:
-                    update_after_action(final_action["action"], data_dir)
-        else:
-            executed = True
+                executed = True
 
-        log_decision(sensor_data, single, validation,
-                     executed=executed, data_dir=data_dir, source=source)
-        actions_taken.append({
-            "action": final_action.get("action", "unknown"),
-            "executed": executed,
-        })
+            log_decision(sensor_data, single, validation,
+                         executed=executed, data_dir=data_dir, source=source,
+                         timestamp=logged_at)
+            actions_taken.append({
+                "action": final_action.get("action", "unknown"),
+                "executed": executed,
+            })
 
     return actions_taken
 
@@ -368,10 +397,14 @@ def apply_hardware_update(
 ) -> None:
     """Apply dot-notation updates to the hardware profile and save.
 
+    All updates are merged first and the profile is written once, and
+    only if a value actually changed.
+
     Args:
         updates: Dict with dot-notation keys like "pump.flow_rate_ml_per_sec".
         hardware_profile: Current hardware profile dict (mutated in place).
     """
+    changed = False
     for dotkey, value in updates.items():
         parts = dotkey.split(".")
         target = hardware_profile
@@ -379,15 +412,25 @@ def apply_hardware_update(
             if part not in target or not isinstance(target[part], dict):
                 target[part] = {}
             target = target[part]
-        target[parts[-1]] = value
+        key = parts[-1]
+        if key in target and target[key] == value:
+            continue
+        target[key] = value
+        changed = True
         logger.info("Hardware profile updated: %s = %s", dotkey, value)
 
+    if not changed:
+        return
     try:
         save_hardware_profile(hardware_profile)
     except Exception as e:
         logger.error("Failed to save hardware profile: %s", e)
 
 
+# Status-bar icon per decision urgency; anything else shows "⚪".
+_URGENCY_ICONS = {"normal": "🟢", "attention": "🟡", "critical": "🔴"}
+
+
 def format_summary_text(summary: dict) -> str:
     """Format a check summary into a concise Telegram message.
 
@@ -417,16 +460,13 @@ def format_summary_text(summary: dict) -> str:
     lines: list[str] = []
 
     # --- Status bar: one-line snapshot ---
-    urgency_icon = {"normal": "🟢", "attention": "🟡", "critical": "🔴"}.get(
-        urgency, "⚪"
-    )
-    status_parts = [urgency_icon]
+    tank_ok = sd.get("water_tank_ok") if sd else None
+    status_parts = [_URGENCY_ICONS.get(urgency, "⚪")]
     if sd:
         status_parts.append(f"{sd['temperature_c']}°C")
         status_parts.append(f"💧{sd['soil_moisture_pct']}%")
-        if sd.get("water_tank_ok") is not None:
-            tank = "🪣OK" if sd["water_tank_ok"] else "🪣LOW⚠️"
-            status_parts.append(tank)
+        if tank_ok is not None:
+            status_parts.append("🪣OK" if tank_ok else "🪣LOW⚠️")
     lines.append(" | ".join(status_parts))
 
     # --- Actions executed (only if something happened) ---
@@ -459,16 +499,17 @@ def format_summary_text(summary: dict) -> str:
     # --- Verbose sections (only for attention/critical/error) ---
     if verbose:
         if sd:
-            lines.append("")
-            lines.append("📊 Sensors:")
-            lines.append(f"  🌡 Temp: {sd['temperature_c']}°C")
-            lines.append(f"  💧 Humidity: {sd['humidity_pct']}%")
-            lines.append(f"  🌿 Soil: {sd['soil_moisture_pct']}%")
-            lines.append(f"  💨 CO2: {sd['co2_ppm']} ppm")
-            lines.append(f"  ☀️ Light: {sd['light_level']}")
-            if sd.get("water_tank_ok") is not None:
-                tank_str = "OK" if sd["water_tank_ok"] else "LOW ⚠️"
-                lines.append(f"  🪣 Water tank: {tank_str}")
+            lines.extend((
+                "",
+                "📊 Sensors:",
+                f"  🌡 Temp: {sd['temperature_c']}°C",
+                f"  💧 Humidity: {sd['humidity_pct']}%",
+                f"  🌿 Soil: {sd['soil_moisture_pct']}%",
+                f"  💨 CO2: {sd['co2_ppm']} ppm",
+                f"  ☀️ Light: {sd['light_level']}",
+            ))
+            if tank_ok is not None:
+                lines.append(f"  🪣 Water tank: {'OK' if tank_ok else 'LOW ⚠️'}")
             if sd.get("heater_lockout"):
                 lines.append("  🔒 Heater lockout: ACTIVE")
 
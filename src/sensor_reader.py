@@ -1,6 +1,7 @@
 """Sensor reader for plant-ops-ai.
 
-Reads sensor data from farmctl.py via subprocess, parses JSON output.
+Reads sensor data from farmctl.py (in-process when possible, otherwise via
+subprocess), parses JSON output.
 Includes mock mode for local development without hardware.
 """
 
@@ -14,6 +15,10 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
+from src.farmctl_runner import load_farmctl
+
 logger = logging.getLogger(__name__)
 
 # Soil moisture exponential calibration (log-linear fit).
@@ -99,8 +104,9 @@ def read_sensors(
 ) -> SensorData:
     """Read current sensor data by calling farmctl.py status --json.
 
-    Retries on failure (port busy, timeout, parse error). Each attempt
-    uses a fresh subprocess call.
+    Retries on failure (port busy, timeout, parse error). Runs through the
+    bot's shared in-process farmctl connection when available, otherwise
+    each attempt uses a fresh subprocess call.
 
     Args:
         farmctl_path: Path to the farmctl.py script.
@@ -114,27 +120,33 @@ def read_sensors(
         SensorReadError: If all attempts fail.
     """
     last_error: Optional[Exception] = None
+    inproc = load_farmctl(farmctl_path)
 
     for attempt in range(1, attempts + 1):
         try:
-            result = subprocess.run(
-                ["python3", farmctl_path, "status", "--json"],
-                capture_output=True,
-                text=True,
-                timeout=read_seconds + 5.0,  # extra buffer beyond read time
-            )
+            if inproc is not None:
+                returncode, stdout, stderr = inproc.run(["status", "--json"])
+            else:
+                result = subprocess.run(
+                    ["python3", farmctl_path, "status", "--json"],
+                    capture_output=True,
+                    text=True,
+                    timeout=read_seconds + 5.0,  # extra buffer beyond read time
+                )
+                returncode, stdout, stderr = (
+                    result.returncode, result.stdout, result.stderr
+                )
 
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
+            if returncode != 0:
                 raise SensorReadError(
-                    f"farmctl.py exited with code {result.returncode}: {stderr}"
+                    f"farmctl.py exited with code {returncode}: {stderr.strip()}"
                 )
 
-            raw = result.stdout.strip()
+            raw = stdout.strip()
             if not raw:
                 raise SensorReadError("farmctl.py returned empty output")
 
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             return _parse_sensor_json(data)
 
         except subprocess.TimeoutExpired:
@@ -3,6 +3,7 @@
 import json
 import os
 import subprocess
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -10,8 +11,8 @@ import pytest
 from src.action_executor import (
     ActionExecutor,
     ExecutionResult,
-    _ACTION_MAP,
-    _NOOP_ACTIONS,
+    _build_argv,
+    _utc_now_iso,
 )
 
 
@@ -53,9 +54,9 @@ class TestNoopActions:
         assert result.command == ""
         assert "no hardware command" in result.output
 
-    def test_noop_actions_set(self):
-        assert "do_nothing" in _NOOP_ACTIONS
-        assert "notify_human" in _NOOP_ACTIONS
+    def test_noop_actions_have_empty_argv(self):
+        assert _build_argv("do_nothing", {}) == []
+        assert _build_argv("notify_human", {}) == []
 
 
 # ---------------------------------------------------------------------------
@@ -161,51 +162,51 @@ class TestDryRun:
 
 
 # ---------------------------------------------------------------------------
-# _ACTION_MAP
+# _build_argv
 # ---------------------------------------------------------------------------
 
 
-class TestActionMap:
+class TestBuildArgv:
     def test_water_builds_correct_args(self):
-        builder = _ACTION_MAP["water"]
-        args = builder({"duration_sec": 15})
+        args = _build_argv("water", {"duration_sec": 15})
         assert args == ["pump", "on", "--sec", "15"]
 
     def test_water_default_duration(self):
-        builder = _ACTION_MAP["water"]
-        args = builder({})
+        args = _build_argv("water", {})
         assert args == ["pump", "on", "--sec", "5"]
 
     def test_light_on_args(self):
-        builder = _ACTION_MAP["light_on"]
-        args = builder({})
+        args = _build_argv("light_on", {})
         assert args == ["light", "on"]
 
     def test_light_off_args(self):
-        builder = _ACTION_MAP["light_off"]
-        args = builder({})
+        args = _build_argv("light_off", {})
         assert args == ["light", "off"]
 
     def test_heater_on_args(self):
-        builder = _ACTION_MAP["heater_on"]
-        args = builder({})
+        args = _build_argv("heater_on", {})
         assert args == ["heater", "on"]
 
     def test_heater_off_args(self):
-        builder = _ACTION_MAP["heater_off"]
-        args = builder({})
+        args = _build_argv("heater_off", {})
         assert args == ["heater", "off"]
 
     def test_circulation_builds_correct_args(self):
-        builder = _ACTION_MAP["circulation"]
-        args = builder({"duration_sec": 120})
+        args = _build_argv("circulation", {"duration_sec": 120})
         assert args == ["circulation", "on", "--sec", "120"]
 
     def test_circulation_default_duration(self):
-        builder = _ACTION_MAP["circulation"]
-        args = builder({})
+        args = _build_argv("circulation", {})
         assert args == ["circulation", "on", "--sec", "30"]
 
+    def test_unknown_action_returns_none(self):
+        assert _build_argv("explode", {}) is None
+
+    def test_fixed_args_are_fresh_lists(self):
+        args = _build_argv("light_on", {})
+        args.append("--json")
+        assert _build_argv("light_on", {}) == ["light", "on"]
+
 
 # ---------------------------------------------------------------------------
 # take_photo
@@ -315,11 +316,76 @@ class TestLiveMode:
         assert "not found" in result.error
 
 
+# ---------------------------------------------------------------------------
+# In-process farmctl
+# ---------------------------------------------------------------------------
+
+_FAKE_FARMCTL = """
+serial = object()
+
+class SerialClient:
+    pass
+
+def execute(argv, sc=None):
+    if argv[0] == "heater":
+        return 1, "", "ERROR: heater relay stuck"
+    return 0, "ok " + " ".join(argv) + "\\n", ""
+"""
+
+
+class TestInProcessFarmctl:
+    def _write_farmctl(self, tmp_path, source=_FAKE_FARMCTL):
+        path = tmp_path / "farmctl.py"
+        path.write_text(source)
+        return str(path)
+
+    def test_runs_without_subprocess(self, tmp_path):
+        executor = ActionExecutor(self._write_farmctl(tmp_path), dry_run=False)
+        with patch("src.action_executor.subprocess.run") as mock_run:
+            result = executor.execute({"action": "water", "params": {"duration_sec": 8}})
+
+        mock_run.assert_not_called()
+        assert result.success is True
+        assert result.output == "ok pump on --sec 8"
+
+    def test_nonzero_exit_is_failure(self, tmp_path):
+        executor = ActionExecutor(self._write_farmctl(tmp_path), dry_run=False)
+        result = executor.execute({"action": "heater_on", "params": {}})
+
+        assert result.success is False
+        assert "heater relay stuck" in result.error
+
+    def test_falls_back_without_pyserial(self, tmp_path):
+        path = self._write_farmctl(
+            tmp_path, _FAKE_FARMCTL.replace("serial = object()", "serial = None")
+        )
+        executor = ActionExecutor(path, dry_run=False)
+        mock_result = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="light on\n", stderr=""
+        )
+        with patch("src.action_executor.subprocess.run", return_value=mock_result) as mock_run:
+            result = executor.execute({"action": "light_on", "params": {}})
+
+        mock_run.assert_called_once()
+        assert result.success is True
+        assert result.output == "light on"
+
+
 # ---------------------------------------------------------------------------
 # ExecutionResult
 # ---------------------------------------------------------------------------
 
 
+class TestUtcNowIso:
+    def test_is_current_utc_isoformat(self):
+        ts = datetime.fromisoformat(_utc_now_iso())
+        assert ts.utcoffset() == timedelta(0)
+        assert abs(datetime.now(timezone.utc) - ts) < timedelta(seconds=5)
+
+    def test_always_has_microseconds(self):
+        assert len(_utc_now_iso()) == len("2026-02-18T10:30:00.000000+00:00")
+
+
 class TestExecutionResult:
     def test_to_dict(self):
         er = ExecutionResult(
@@ -414,6 +480,28 @@ class TestTakePhotoWithLight:
         assert "camera-snap" in calls[1]
         assert "light" in calls[2] and "off" in calls[2]
 
+    def test_settle_overlaps_camera_instead_of_sleeping(self, tmp_path):
+        """Settle time is folded into camera-snap --timeout-ms, no sleep."""
+        data_dir = str(tmp_path / "data")
+        self._write_actuator_state(data_dir, light="off")
+
+        executor = _make_executor(dry_run=False)
+        mock_result = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="ok", stderr=""
+        )
+
+        with patch("src.action_executor.subprocess.run", return_value=mock_result) as mock_run:
+            with patch("time.sleep") as mock_sleep:
+                executor.take_photo_with_light(
+                    output_path=str(tmp_path / "photo.jpg"),
+                    data_dir=data_dir,
+                    settle_time=3.0,
+                )
+
+        mock_sleep.assert_not_called()
+        snap_cmd = mock_run.call_args_list[1].args[0]
+        assert snap_cmd[-2:] == ["--timeout-ms", "3000"]
+
     def test_archives_photo_with_timestamp(self, tmp_path):
         """When photos_dir is set, should copy photo to timestamped archive."""
         data_dir = str(tmp_path / "data")
@@ -0,0 +1,165 @@
+"""Tests for src/actuator_state.py -- actuator state cache."""
+
+import json
+from pathlib import Path
+
+from src.actuator_state import (
+    DEFAULT_STATE,
+    STATE_FILE,
+    load_actuator_state,
+    reconcile_actuator_state,
+    update_after_action,
+    update_after_actions,
+)
+
+
+def _count_saves(monkeypatch) -> list[dict]:
+    """Record each state dict passed to _save_state (which still writes)."""
+    import src.actuator_state as actuator_state
+
+    writes: list[dict] = []
+    real_save = actuator_state._save_state
+
+    def _save(state, data_dir):
+        writes.append(dict(state))
+        real_save(state, data_dir)
+
+    monkeypatch.setattr(actuator_state, "_save_state", _save)
+    return writes
+
+
+class TestUpdateAfterActions:
+    def test_single_action(self, tmp_path):
+        update_after_action("heater_on", str(tmp_path))
+        assert load_actuator_state(str(tmp_path))["heater"] == "on"
+
+    def test_applies_in_order(self, tmp_path):
+        update_after_actions(["light_on", "heater_on", "light_off"], str(tmp_path))
+
+        state = load_actuator_state(str(tmp_path))
+        assert state["light"] == "off"
+        assert state["heater"] == "on"
+
+    def test_noop_actions_do_not_write(self, tmp_path):
+        update_after_actions(["do_nothing", "notify_human"], str(tmp_path))
+        assert not (Path(tmp_path) / STATE_FILE).exists()
+
+    def test_writes_once(self, tmp_path, monkeypatch):
+        writes = _count_saves(monkeypatch)
+        update_after_actions(["light_on", "heater_on"], str(tmp_path))
+
+        assert len(writes) == 1
+        saved = json.loads((Path(tmp_path) / STATE_FILE).read_text())
+        assert saved == {**DEFAULT_STATE, "light": "on", "heater": "on"}
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        update_after_actions(["light_on"], str(tmp_path))
+        assert sorted(p.name for p in Path(tmp_path).iterdir()) == [STATE_FILE]
+
+    def test_failed_replace_removes_temp_file(self, tmp_path, monkeypatch):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.fileutil.os.replace", fail_replace)
+        update_after_actions(["light_on"], str(tmp_path))
+        assert list(Path(tmp_path).iterdir()) == []
+
+    def test_write_keeps_file_mode(self, tmp_path):
+        state_file = Path(tmp_path) / STATE_FILE
+        update_after_action("light_on", str(tmp_path))
+        state_file.chmod(0o644)
+
+        update_after_action("light_off", str(tmp_path))
+
+        assert state_file.stat().st_mode & 0o777 == 0o644
+
+    def test_unchanged_state_is_not_rewritten(self, tmp_path, monkeypatch):
+        update_after_action("light_off", str(tmp_path))
+        writes = _count_saves(monkeypatch)
+
+        # Light toggled on and back off around a night photo
+        update_after_actions(["light_on", "light_off"], str(tmp_path))
+
+        assert writes == []
+        assert load_actuator_state(str(tmp_path))["light"] == "off"
+
+
+class TestLoadActuatorState:
+    def test_missing_file_returns_defaults(self, tmp_path):
+        assert load_actuator_state(str(tmp_path)) == DEFAULT_STATE
+
+    def test_fills_missing_keys(self, tmp_path):
+        (Path(tmp_path) / STATE_FILE).write_text('{"light": "on"}')
+        assert load_actuator_state(str(tmp_path)) == {**DEFAULT_STATE, "light": "on"}
+
+    def test_corrupt_file_returns_defaults(self, tmp_path):
+        (Path(tmp_path) / STATE_FILE).write_text("{not json")
+        assert load_actuator_state(str(tmp_path)) == DEFAULT_STATE
+
+    def test_non_object_file_returns_defaults(self, tmp_path):
+        (Path(tmp_path) / STATE_FILE).write_text('["on"]')
+        assert load_actuator_state(str(tmp_path)) == DEFAULT_STATE
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        update_after_action("heater_on", str(tmp_path))
+
+        import src.actuator_state as actuator_state
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("state file re-parsed")
+
+        monkeypatch.setattr(actuator_state.orjson, "loads", _fail)
+        assert load_actuator_state(str(tmp_path))["heater"] == "on"
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        update_after_action("heater_on", str(tmp_path))
+        state_file = Path(tmp_path) / STATE_FILE
+        state_file.write_text(json.dumps({**DEFAULT_STATE, "heater": "off", "light": "on"}))
+
+        state = load_actuator_state(str(tmp_path))
+        assert state["heater"] == "off"
+        assert state["light"] == "on"
+
+    def test_returns_independent_copies(self, tmp_path):
+        update_after_action("heater_on", str(tmp_path))
+        load_actuator_state(str(tmp_path))["heater"] = "off"
+        assert load_actuator_state(str(tmp_path))["heater"] == "on"
+
+
+class TestReconcileActuatorState:
+    def test_hardware_values_override_file(self, tmp_path):
+        update_after_action("heater_on", str(tmp_path))
+        state = reconcile_actuator_state(
+            {
+                "light_on": True,
+                "heater_on": False,
+                "water_pump_on": True,
+                "circulation_on": False,
+                "water_tank_ok": False,
+                "heater_lockout": True,
+            },
+            str(tmp_path),
+        )
+
+        assert state == {
+            "light": "on",
+            "heater": "off",
+            "pump": "running",
+            "circulation": "idle",
+            "water_tank": "low",
+            "heater_lockout": "active",
+        }
+        assert load_actuator_state(str(tmp_path)) == state
+
+    def test_missing_hardware_values_keep_file_state(self, tmp_path):
+        update_after_action("heater_on", str(tmp_path))
+        state = reconcile_actuator_state({"light_on": None, "temperature_c": 21.0}, str(tmp_path))
+        assert state == {**DEFAULT_STATE, "heater": "on"}
+
+    def test_unchanged_hardware_state_is_not_rewritten(self, tmp_path, monkeypatch):
+        update_after_action("heater_on", str(tmp_path))
+        writes = _count_saves(monkeypatch)
+
+        reconcile_actuator_state({"light_on": False, "heater_on": True}, str(tmp_path))
+
+        assert writes == []
@@ -0,0 +1,68 @@
+"""Tests for src/claude_client.py -- response parsing helpers."""
+
+import pytest
+
+from src.claude_client import TokenUsageTracker, _extract_json
+
+
+# ---------------------------------------------------------------------------
+# _extract_json
+# ---------------------------------------------------------------------------
+
+class TestExtractJson:
+    def test_plain_object(self):
+        assert _extract_json('{"action": "water"}') == {"action": "water"}
+
+    def test_code_fence_with_language(self):
+        text = '```json\n{"action": "light_on", "params": {}}\n```'
+        assert _extract_json(text) == {"action": "light_on", "params": {}}
+
+    def test_surrounding_prose(self):
+        text = 'Here is my decision:\n{"action": "do_nothing"}\nLet me know!'
+        assert _extract_json(text) == {"action": "do_nothing"}
+
+    def test_first_of_two_objects(self):
+        assert _extract_json('{"a": 1} {"b": 2}') == {"a": 1}
+
+    def test_no_object_raises(self):
+        with pytest.raises(ValueError, match="no JSON object found"):
+            _extract_json("I can't decide right now.")
+
+    def test_truncated_decision_does_not_return_nested_action(self):
+        text = (
+            '{"assessment": "dry", "actions": [{"action": "water", '
+            '"params": {"duration_sec": 5}, "reason": "dry"}], "urgency": "norm'
+        )
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            _extract_json(text)
+
+    def test_truncated_chat_reply_does_not_return_nested_update(self):
+        text = (
+            '{"message": "Updated.", "hardware_update": {"pump.flow_rate_ml_per_sec": 3.5}, '
+            '"observations": ["lea'
+        )
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            _extract_json(text)
+
+    def test_truncated_object_raises(self):
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            _extract_json('{"action": "water", "params": {')
+
+
+# ---------------------------------------------------------------------------
+# TokenUsageTracker
+# ---------------------------------------------------------------------------
+
+class TestTokenUsageTracker:
+    def test_cost_accumulates_per_call(self):
+        tracker = TokenUsageTracker()
+        tracker.record(1_000_000, 0)
+        tracker.record(0, 100_000)
+
+        assert tracker.estimated_cost_usd == pytest.approx(3.0 + 1.5)
+        assert tracker.summary() == {
+            "calls": 2,
+            "input_tokens": 1_000_000,
+            "output_tokens": 100_000,
+            "estimated_cost_usd": 4.5,
+        }
@@ -0,0 +1,96 @@
+"""Tests for src/config_loader.py -- YAML config loading and caching."""
+
+from unittest.mock import patch
+
+import pytest
+
+import src.config_loader as config_loader
+from src.config_loader import (
+    load_hardware_profile,
+    load_plant_profile,
+    load_safety_limits,
+    save_hardware_profile,
+    save_plant_profile,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Point CONFIG_DIR at a temp directory and reset the config cache."""
+    with patch.object(config_loader, "CONFIG_DIR", tmp_path), \
+         patch.dict(config_loader._YAML_CACHE, clear=True):
+        yield tmp_path
+
+
+class TestLoadPlantProfile:
+    def test_missing_file_raises(self, config_dir):
+        with pytest.raises(FileNotFoundError):
+            load_plant_profile()
+
+    def test_returns_independent_copies(self, config_dir):
+        (config_dir / "plant_profile.yaml").write_text("plant:\n  name: basil\n")
+        first = load_plant_profile()
+        first["plant"]["name"] = "mutated"
+        assert load_plant_profile()["plant"]["name"] == "basil"
+
+    def test_save_invalidates_cache(self, config_dir):
+        (config_dir / "plant_profile.yaml").write_text("plant:\n  name: basil\n")
+        profile = load_plant_profile()
+        profile["plant"]["name"] = "mint"
+        save_plant_profile(profile)
+        assert load_plant_profile()["plant"]["name"] == "mint"
+
+    def test_reloads_when_file_changes(self, config_dir):
+        path = config_dir / "plant_profile.yaml"
+        path.write_text("plant:\n  name: basil\n")
+        assert load_plant_profile()["plant"]["name"] == "basil"
+        path.write_text("plant:\n  name: tomato\n")
+        assert load_plant_profile()["plant"]["name"] == "tomato"
+
+
+class TestOtherConfigFiles:
+    def test_safety_limits_cached_until_changed(self, config_dir):
+        path = config_dir / "safety_limits.yaml"
+        path.write_text("water:\n  max_duration_sec: 30\n")
+        assert load_safety_limits()["water"]["max_duration_sec"] == 30
+
+        with patch.object(config_loader, "load_yaml", side_effect=AssertionError("re-parsed")):
+            assert load_safety_limits()["water"]["max_duration_sec"] == 30
+
+        path.write_text("water:\n  max_duration_sec: 45\n")
+        assert load_safety_limits()["water"]["max_duration_sec"] == 45
+
+    def test_hardware_profile_save_invalidates_cache(self, config_dir):
+        (config_dir / "hardware_profile.yaml").write_text("sensors:\n  co2: true\n")
+        profile = load_hardware_profile()
+        profile["sensors"]["co2"] = False
+        save_hardware_profile(profile)
+        assert load_hardware_profile()["sensors"]["co2"] is False
+
+    def test_save_leaves_no_temp_file(self, config_dir):
+        save_hardware_profile({"sensors": {"co2": True}})
+        assert sorted(p.name for p in config_dir.iterdir()) == ["hardware_profile.yaml"]
+
+    def test_failed_save_removes_temp_file(self, config_dir):
+        with patch("src.fileutil.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_hardware_profile({"sensors": {"co2": True}})
+        assert list(config_dir.iterdir()) == []
+
+    def test_save_keeps_file_mode(self, config_dir):
+        path = config_dir / "plant_profile.yaml"
+        path.write_text("plant:\n  name: basil\n")
+        path.chmod(0o644)
+        save_plant_profile({"plant": {"name": "mint"}})
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_new_file_gets_umask_default_mode(self, config_dir):
+        reference = config_dir / "reference"
+        reference.touch()
+        save_hardware_profile({"sensors": {"co2": True}})
+        mode = (config_dir / "hardware_profile.yaml").stat().st_mode & 0o777
+        assert mode == reference.stat().st_mode & 0o777
+
+    def test_missing_safety_limits_raises(self, config_dir):
+        with pytest.raises(FileNotFoundError):
+            load_safety_limits()
@@ -0,0 +1,109 @@
+"""Tests for src/farmctl_runner.py -- in-process farmctl.py execution."""
+
+import time
+
+import src.farmctl_runner as farmctl_runner
+from src.farmctl_runner import load_farmctl
+
+
+_FAKE_FARMCTL = """
+import argparse
+import sys
+
+serial = object()
+
+class SerialClient:
+    closes = 0
+
+    def close(self):
+        self.closes += 1
+
+def execute(argv, sc=None):
+    if argv[0] == "boom":
+        raise RuntimeError("port vanished")
+    if argv[0] == "bad":
+        argparse.ArgumentParser().parse_args(["--nope"])
+    if argv[0] == "help":
+        argparse.ArgumentParser().parse_args(["--help"])
+    if argv[0] == "exit":
+        sys.exit(int(argv[1]) if argv[1].isdigit() else argv[1])
+    return 0, "ran " + " ".join(argv), ""
+"""
+
+
+def _write_farmctl(tmp_path, source=_FAKE_FARMCTL):
+    path = tmp_path / "farmctl.py"
+    path.write_text(source)
+    return str(path)
+
+
+class TestLoadFarmctl:
+    def test_loads_and_caches(self, tmp_path):
+        path = _write_farmctl(tmp_path)
+        inproc = load_farmctl(path)
+
+        assert inproc is not None
+        assert load_farmctl(path) is inproc
+
+    def test_missing_script_returns_none(self, tmp_path):
+        assert load_farmctl(str(tmp_path / "missing.py")) is None
+
+    def test_without_pyserial_returns_none(self, tmp_path):
+        path = _write_farmctl(
+            tmp_path, _FAKE_FARMCTL.replace("serial = object()", "serial = None")
+        )
+        assert load_farmctl(path) is None
+
+
+class TestInProcessRun:
+    def test_returns_cli_result(self, tmp_path):
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+        assert inproc.run(["light", "on"]) == (0, "ran light on", "")
+
+    def test_exception_becomes_error_result(self, tmp_path):
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+        rc, out, err = inproc.run(["boom"])
+
+        assert rc == 1
+        assert out == ""
+        assert "port vanished" in err
+
+    def test_argparse_exit_becomes_error_result(self, tmp_path):
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+        rc, _, err = inproc.run(["bad"])
+
+        assert rc == 2
+        assert "invalid arguments" in err
+
+    def test_successful_exit_is_not_an_error(self, tmp_path, capsys):
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+
+        assert inproc.run(["help"]) == (0, "", "")
+        assert inproc.run(["exit", "0"]) == (0, "", "")
+
+    def test_other_exit_codes_pass_through(self, tmp_path):
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+
+        assert inproc.run(["exit", "3"]) == (3, "", "")
+        assert inproc.run(["exit", "no serial port"]) == (1, "", "no serial port")
+
+    def test_idle_port_is_closed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(farmctl_runner, "PORT_IDLE_CLOSE_S", 0.01)
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+        inproc.run(["light", "on"])
+
+        deadline = time.monotonic() + 2
+        while inproc.serial_client.closes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert inproc.serial_client.closes == 1
+
+    def test_new_run_postpones_idle_close(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(farmctl_runner, "PORT_IDLE_CLOSE_S", 60)
+        inproc = load_farmctl(_write_farmctl(tmp_path))
+        inproc.run(["light", "on"])
+        first = inproc._idle_timer
+        inproc.run(["light", "off"])
+
+        assert first.finished.is_set()  # cancelled
+        assert inproc._idle_timer is not first
+        inproc._idle_timer.cancel()
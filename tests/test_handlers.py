@@ -1,7 +1,9 @@
 """Tests for bot.handlers helper functions."""
 
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # bot.handlers imports telegram which isn't installed locally.
 # Stub the module so we can import the pure-Python helpers.
@@ -10,7 +12,16 @@ sys.modules.setdefault("telegram", _telegram_mock)
 sys.modules.setdefault("telegram.ext", _telegram_mock)
 sys.modules.setdefault("bot.keyboards", MagicMock())
 
-from bot.handlers import _split_text, TELEGRAM_MAX_LENGTH
+from bot.handlers import (
+    TELEGRAM_MAX_LENGTH,
+    BotConfig,
+    _load_recent_decisions,
+    _parse_duration,
+    _parse_int_arg,
+    _read_prefix,
+    _read_sensors_or_mock,
+    _split_text,
+)
 
 
 class TestSplitText:
@@ -79,3 +90,117 @@ class TestSplitText:
         all_content = "".join(chunks)
         assert all_content.count("short") == 10
         assert "x" * 100 in all_content
+
+
+class TestLoadRecentDecisions:
+    """Tests for _load_recent_decisions()."""
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert _load_recent_decisions(tmp_path / "decisions.jsonl") == []
+
+    def test_returns_last_n(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        path.write_text("".join(f'{{"i": {i}}}\n' for i in range(10)))
+        entries = _load_recent_decisions(path, n=3)
+        assert [e["i"] for e in entries] == [7, 8, 9]
+
+    def test_cache_invalidated_on_append(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        path.write_text('{"i": 1}\n')
+        assert [e["i"] for e in _load_recent_decisions(path, n=5)] == [1]
+        with open(path, "a") as f:
+            f.write('{"i": 2}\n')
+        assert [e["i"] for e in _load_recent_decisions(path, n=5)] == [1, 2]
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        path.write_text('{"i": 1}\n\nnot json\n{"i": 2}\n')
+        entries = _load_recent_decisions(path, n=5)
+        assert [e["i"] for e in entries] == [1, 2]
+
+
+class TestReadPrefix:
+    """Tests for _read_prefix()."""
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert _read_prefix(tmp_path / "missing.md") is None
+
+    def test_short_file_returned_whole(self, tmp_path):
+        path = tmp_path / "k.md"
+        path.write_text("short notes")
+        assert _read_prefix(path) == "short notes"
+
+    def test_long_file_truncated(self, tmp_path):
+        path = tmp_path / "k.md"
+        path.write_text("é" * 600)
+        assert _read_prefix(path, limit=500) == "é" * 500 + "..."
+
+
+class TestReadSensorsOrMock:
+    """Tests for _read_sensors_or_mock()."""
+
+    def test_returns_real_reading(self):
+        reading = MagicMock()
+        with patch("bot.handlers.read_sensors", return_value=reading):
+            assert _read_sensors_or_mock("/fake/farmctl.py") is reading
+
+    def test_falls_back_to_mock_on_error(self):
+        mock_reading = MagicMock()
+        with patch("bot.handlers.read_sensors", side_effect=RuntimeError("timeout")), \
+             patch("bot.handlers.read_sensors_mock", return_value=mock_reading):
+            assert _read_sensors_or_mock("/fake/farmctl.py") is mock_reading
+
+
+class TestParseArgs:
+    """Tests for _parse_int_arg() and _parse_duration()."""
+
+    def test_default_when_no_args(self):
+        assert _parse_int_arg([], 5) == 5
+        assert _parse_int_arg(None, 5) == 5
+
+    def test_signed_and_padded_values(self):
+        assert _parse_int_arg(["+7"], 5) == 7
+        assert _parse_int_arg(["-3"], 5) == -3
+        assert _parse_int_arg([" 12 "], 5) == 12
+
+    def test_non_integer_returns_none(self):
+        for bad in ("abc", "1.5", "", "-", "²"):
+            assert _parse_int_arg([bad], 5) is None
+
+    def test_duration_in_range(self):
+        assert _parse_duration(["10"], 5, 1, 30, "usage") == (10, None)
+
+    def test_duration_out_of_range(self):
+        duration, error = _parse_duration(["31"], 5, 1, 30, "usage")
+        assert error == "Duration must be between 1 and 30 seconds."
+
+    def test_duration_bad_input_returns_usage(self):
+        assert _parse_duration(["x"], 5, 1, 30, "usage") == (0, "usage")
+
+
+class TestBotConfig:
+    """Tests for BotConfig."""
+
+    def _make(self, tmp_path, chat_ids=(123, 456)):
+        return BotConfig(
+            data_dir=tmp_path,
+            chat_ids=chat_ids,
+            farmctl_path="farmctl.py",
+            anthropic_api_key="sk-secret",
+        )
+
+    def test_derived_fields(self, tmp_path):
+        cfg = self._make(tmp_path)
+        assert cfg.pause_file == tmp_path / ".paused"
+        assert cfg.allowed_chat_ids == frozenset({123, 456})
+
+    def test_empty_chat_ids_allows_everyone(self, tmp_path):
+        assert not self._make(tmp_path, chat_ids=()).allowed_chat_ids
+
+    def test_is_frozen(self, tmp_path):
+        cfg = self._make(tmp_path)
+        with pytest.raises(AttributeError):
+            cfg.farmctl_path = "other"
+
+    def test_repr_hides_api_key(self, tmp_path):
+        assert "sk-secret" not in repr(self._make(tmp_path))
@@ -1,6 +1,8 @@
 """Tests for src/logger.py -- JSONL logging of sensors and decisions."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -15,8 +17,12 @@ from src.logger import (
     load_recent_decisions,
     load_recent_sensors,
     get_daily_action_counts,
-    _read_jsonl,
+    recent_records,
+    _tail_jsonl,
     _append_jsonl,
+    _append_jsonl_many,
+    log_plant_observations,
+    load_recent_plant_log,
 )
 from src.safety import ValidationResult
 from src.sensor_reader import SensorData
@@ -93,6 +99,13 @@ class TestLogSensorReading:
         record = json.loads(filepath.read_text().strip())
         assert "logged_at" in record
 
+    def test_uses_given_timestamp(self, tmp_data_dir):
+        log_sensor_reading(_make_sensor_data(), tmp_data_dir, timestamp="2026-02-18T10:30:01+00:00")
+
+        filepath = Path(tmp_data_dir) / SENSOR_FILE
+        record = json.loads(filepath.read_text().strip())
+        assert record["logged_at"] == "2026-02-18T10:30:01+00:00"
+
     def test_record_contains_sensor_fields(self, tmp_data_dir):
         sensor = _make_sensor_data()
         log_sensor_reading(sensor, tmp_data_dir)
@@ -164,6 +177,41 @@ class TestLogDecision:
         assert record["executed"] is False
         assert record["validation"]["valid"] is False
 
+    def test_recreates_deleted_log(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        filepath = Path(tmp_data_dir) / DECISION_FILE
+
+        log_decision(sensor, _make_decision(), _make_validation(),
+                     executed=True, data_dir=tmp_data_dir)
+        filepath.unlink()
+        log_decision(sensor, _make_decision(), _make_validation(),
+                     executed=True, data_dir=tmp_data_dir)
+
+        assert len(_tail_jsonl(filepath, 10)) == 1
+
+    def test_explicit_timestamp(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        ts = "2026-02-18T10:30:00+00:00"
+
+        log_decision(sensor, _make_decision(), _make_validation(),
+                     executed=True, data_dir=tmp_data_dir, timestamp=ts)
+
+        filepath = Path(tmp_data_dir) / DECISION_FILE
+        record = json.loads(filepath.read_text().strip())
+        assert record["timestamp"] == ts
+
+    def test_serializes_non_json_values(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        decision = _make_decision()
+        decision["params"] = {1: Path("/tmp/x")}
+
+        log_decision(sensor, decision, _make_validation(),
+                     executed=True, data_dir=tmp_data_dir)
+
+        filepath = Path(tmp_data_dir) / DECISION_FILE
+        record = json.loads(filepath.read_text().strip())
+        assert record["decision"]["params"] == {"1": "/tmp/x"}
+
 
 # ---------------------------------------------------------------------------
 # load_recent_decisions
@@ -228,6 +276,44 @@ class TestLoadRecentDecisions:
 # ---------------------------------------------------------------------------
 
 
+class TestLoadRecentDecisionsCache:
+    def test_unchanged_file_is_not_reread(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        log_decision(sensor, _make_decision("water"), _make_validation(), True, tmp_data_dir)
+        assert len(load_recent_decisions(5, tmp_data_dir)) == 1
+
+        with patch("src.logger._tail_jsonl", side_effect=AssertionError("re-read")):
+            assert len(load_recent_decisions(5, tmp_data_dir)) == 1
+
+    def test_append_invalidates(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        log_decision(sensor, _make_decision("water"), _make_validation(), True, tmp_data_dir)
+        load_recent_decisions(5, tmp_data_dir)
+        log_decision(sensor, _make_decision("light_on"), _make_validation(), True, tmp_data_dir)
+
+        records = load_recent_decisions(5, tmp_data_dir)
+        assert [r["decision"]["action"] for r in records] == ["water", "light_on"]
+
+
+    def test_returned_records_are_copies(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        log_decision(sensor, _make_decision("water"), _make_validation(), True, tmp_data_dir)
+        load_recent_decisions(5, tmp_data_dir)[0]["decision"]["action"] = "mutated"
+
+        assert load_recent_decisions(5, tmp_data_dir)[0]["decision"]["action"] == "water"
+
+    def test_concurrent_readers_evict_safely(self, tmp_data_dir):
+        sensor = _make_sensor_data()
+        log_decision(sensor, _make_decision("water"), _make_validation(), True, tmp_data_dir)
+
+        with patch("src.logger._RECENT_CACHE_MAX", 4), ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(
+                lambda n: load_recent_decisions(n, tmp_data_dir), [n % 50 + 1 for n in range(400)]
+            ))
+
+        assert all(len(r) == 1 for r in results)
+
+
 class TestLoadRecentSensors:
     def test_returns_last_n_records(self, tmp_data_dir):
         filepath = Path(tmp_data_dir) / SENSOR_FILE
@@ -316,6 +402,29 @@ class TestGetDailyActionCounts:
         counts = get_daily_action_counts(tmp_data_dir)
         assert counts.get("water", 0) == 1
 
+    def test_missing_file_returns_empty(self, tmp_data_dir):
+        assert get_daily_action_counts(tmp_data_dir) == {}
+
+    def test_stops_at_earlier_day(self, tmp_data_dir, caplog):
+        filepath = Path(tmp_data_dir) / DECISION_FILE
+        today = datetime.now().astimezone().date().isoformat()
+
+        lines = ["{corrupt line from long ago}"]
+        lines += [
+            json.dumps({"timestamp": "2020-01-01T10:00:00+00:00",
+                        "decision": {"action": "water"}, "executed": True}),
+            json.dumps({"decision": {"action": "light_on"}, "executed": True}),
+            json.dumps({"timestamp": f"{today}T10:00:00+00:00",
+                        "decision": {"action": "water"}, "executed": True}),
+        ]
+        filepath.write_text("\n".join(lines) + "\n")
+
+        with caplog.at_level("WARNING", logger="src.logger"):
+            counts = get_daily_action_counts(tmp_data_dir)
+
+        assert counts == {"water": 1}
+        assert "malformed" not in caplog.text
+
     def test_empty_file_returns_empty_dict(self, tmp_data_dir):
         filepath = Path(tmp_data_dir) / DECISION_FILE
         filepath.touch()
@@ -329,17 +438,17 @@ class TestGetDailyActionCounts:
 
 
 # ---------------------------------------------------------------------------
-# _read_jsonl edge cases
+# recent_records edge cases
 # ---------------------------------------------------------------------------
 
 
-class TestReadJsonl:
+class TestRecentRecords:
     def test_skips_malformed_lines(self, tmp_path):
         filepath = tmp_path / "test.jsonl"
         content = '{"valid": true}\nnot json at all\n{"also_valid": 1}\n'
         filepath.write_text(content)
 
-        records = _read_jsonl(filepath)
+        records = recent_records(filepath, 10)
         assert len(records) == 2
         assert records[0]["valid"] is True
         assert records[1]["also_valid"] == 1
@@ -349,19 +458,19 @@ class TestReadJsonl:
         content = '{"a": 1}\n\n\n{"b": 2}\n'
         filepath.write_text(content)
 
-        records = _read_jsonl(filepath)
+        records = recent_records(filepath, 10)
         assert len(records) == 2
 
     def test_nonexistent_file_returns_empty(self, tmp_path):
         filepath = tmp_path / "nonexistent.jsonl"
-        records = _read_jsonl(filepath)
+        records = recent_records(filepath, 10)
         assert records == []
 
     def test_empty_file_returns_empty(self, tmp_path):
         filepath = tmp_path / "empty.jsonl"
         filepath.touch()
 
-        records = _read_jsonl(filepath)
+        records = recent_records(filepath, 10)
         assert records == []
 
     def test_mixed_valid_and_invalid(self, tmp_path):
@@ -375,13 +484,64 @@ class TestReadJsonl:
         )
         filepath.write_text(content)
 
-        records = _read_jsonl(filepath)
+        records = recent_records(filepath, 10)
         assert len(records) == 3
         assert records[0]["line"] == 1
         assert records[1]["line"] == 3
         assert records[2]["line"] == 5
 
 
+# ---------------------------------------------------------------------------
+# _tail_jsonl
+# ---------------------------------------------------------------------------
+
+
+class TestTailJsonl:
+    @pytest.fixture(params=[3, 7, 8192], ids=["tiny", "small", "default"])
+    def chunk_size(self, request):
+        with patch("src.logger._TAIL_CHUNK_BYTES", request.param):
+            yield request.param
+
+    def test_matches_full_read(self, tmp_path, chunk_size):
+        filepath = tmp_path / "tail.jsonl"
+        filepath.write_text("".join(f'{{"n": {i}}}\n' for i in range(50)))
+
+        for n in (1, 5, 50, 80):
+            assert _tail_jsonl(filepath, n) == [{"n": i} for i in range(50)][-n:]
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path, chunk_size):
+        filepath = tmp_path / "mixed.jsonl"
+        filepath.write_text('{"line": 1}\n{bad json}\n\n{"line": 3}\njust text\n{"line": 5}\n')
+
+        assert _tail_jsonl(filepath, 2) == [{"line": 3}, {"line": 5}]
+        assert _tail_jsonl(filepath, 10) == [{"line": 1}, {"line": 3}, {"line": 5}]
+
+    def test_skips_invalid_utf8_line(self, tmp_path, chunk_size):
+        filepath = tmp_path / "binary.jsonl"
+        filepath.write_bytes(b'{"n": 1}\n{"n": "\xff"}\n{"n": 3}\n')
+
+        assert _tail_jsonl(filepath, 5) == [{"n": 1}, {"n": 3}]
+
+    def test_no_trailing_newline(self, tmp_path, chunk_size):
+        filepath = tmp_path / "partial.jsonl"
+        filepath.write_text('{"n": 1}\n{"n": 2}')
+
+        assert _tail_jsonl(filepath, 1) == [{"n": 2}]
+
+    def test_reads_across_block_boundaries(self, tmp_path):
+        filepath = tmp_path / "big.jsonl"
+        pad = "x" * 500
+        filepath.write_text("".join(f'{{"i": {i}, "pad": "{pad}"}}\n' for i in range(200)))
+
+        assert [r["i"] for r in _tail_jsonl(filepath, 50)] == list(range(150, 200))
+
+    def test_missing_file_and_zero_n(self, tmp_path):
+        assert _tail_jsonl(tmp_path / "missing.jsonl", 5) == []
+        filepath = tmp_path / "one.jsonl"
+        filepath.write_text('{"n": 1}\n')
+        assert _tail_jsonl(filepath, 0) == []
+
+
 # ---------------------------------------------------------------------------
 # _append_jsonl
 # ---------------------------------------------------------------------------
@@ -406,3 +566,64 @@ class TestAppendJsonl:
         assert len(lines) == 2
         assert json.loads(lines[0])["first"] == 1
         assert json.loads(lines[1])["second"] == 2
+
+    def test_reuses_open_handle(self, tmp_path):
+        filepath = tmp_path / "reuse.jsonl"
+        _append_jsonl(filepath, {"n": 1})
+        with patch("builtins.open", side_effect=AssertionError("reopened")):
+            _append_jsonl(filepath, {"n": 2})
+
+        assert _tail_jsonl(filepath, 10) == [{"n": 1}, {"n": 2}]
+
+    def test_concurrent_appends_share_one_handle(self, tmp_path):
+        filepath = tmp_path / "threads.jsonl"
+        real_open = open
+        opens = []
+
+        def slow_open(*args, **kwargs):
+            opens.append(args[0])
+            time.sleep(0.01)  # widen the check-then-open window
+            return real_open(*args, **kwargs)
+
+        with patch("builtins.open", side_effect=slow_open), ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda i: _append_jsonl(filepath, {"n": i}), range(200)))
+
+        assert opens == [filepath]
+        assert sorted(r["n"] for r in _tail_jsonl(filepath, 500)) == list(range(200))
+
+    def test_creates_missing_directory(self, tmp_path):
+        filepath = tmp_path / "nested" / "data.jsonl"
+        _append_jsonl(filepath, {"obs": "Leaves at 22°C look healthy"})
+
+        assert _tail_jsonl(filepath, 10) == [{"obs": "Leaves at 22°C look healthy"}]
+
+
+class TestAppendJsonlMany:
+    def test_appends_all_records(self, tmp_path):
+        filepath = tmp_path / "many.jsonl"
+        filepath.write_text('{"first": 1}\n')
+
+        _append_jsonl_many(filepath, [{"n": 2}, {"n": 3}])
+
+        records = _tail_jsonl(filepath, 10)
+        assert records == [{"first": 1}, {"n": 2}, {"n": 3}]
+
+    def test_empty_list_does_not_create_file(self, tmp_path):
+        filepath = tmp_path / "none.jsonl"
+        _append_jsonl_many(filepath, [])
+        assert not filepath.exists()
+
+
+# ---------------------------------------------------------------------------
+# log_plant_observations
+# ---------------------------------------------------------------------------
+
+
+class TestLogPlantObservations:
+    def test_writes_one_record_per_observation(self, tmp_data_dir):
+        log_plant_observations(["leaf curl", "new growth"], tmp_data_dir, source="chat")
+
+        records = load_recent_plant_log(10, tmp_data_dir)
+        assert [r["observation"] for r in records] == ["leaf curl", "new growth"]
+        assert all(r["source"] == "chat" for r in records)
+        assert records[0]["timestamp"] == records[1]["timestamp"]
@@ -1,5 +1,7 @@
 """Tests for src/plant_agent.py -- main orchestrator."""
 
+import json
+import threading
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
@@ -9,6 +11,8 @@ from src.plant_agent import (
     FALLBACK_RULES,
     append_knowledge_update,
     _apply_fallback_rules,
+    apply_hardware_update,
+    execute_validated_actions,
     format_summary_text,
     run_check,
 )
@@ -626,6 +630,40 @@ class TestRunCheckSafetyRejection:
         assert call_kwargs[1]["executed"] is False or call_kwargs[0][3] is False
 
 
+class TestExecuteValidatedActions:
+    def test_concurrent_callers_respect_water_interval(self, tmp_path):
+        executor = MagicMock()
+        executor.execute.return_value = MagicMock(success=True, command="water")
+        results: list = []
+        barrier = threading.Barrier(2)
+
+        def confirm():
+            barrier.wait()
+            results.extend(execute_validated_actions(
+                actions=[{"action": "water", "params": {"duration_sec": 5}}],
+                decision_context={},
+                sensor_data=_make_sensor_data(soil_moisture_pct=20.0),
+                history=None,
+                executor=executor,
+                data_dir=str(tmp_path),
+                dry_run=True,
+                source="manual_command",
+            ))
+
+        threads = [threading.Thread(target=confirm) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(r["executed"] for r in results) == [False, True]
+        executor.execute.assert_called_once()
+
+        logged = [json.loads(line) for line in (tmp_path / "decisions.jsonl").read_text().splitlines()]
+        timestamps = [r["timestamp"] for r in logged]
+        assert timestamps == sorted(timestamps)
+
+
 # ---------------------------------------------------------------------------
 # append_knowledge_update
 # ---------------------------------------------------------------------------
@@ -757,3 +795,26 @@ class TestFormatSummaryTextNewFields:
         }
         text = format_summary_text(summary)
         assert "AI Notes" not in text
+
+
+# ---------------------------------------------------------------------------
+# apply_hardware_update
+# ---------------------------------------------------------------------------
+
+class TestApplyHardwareUpdate:
+    def test_merges_dot_keys_and_saves_once(self):
+        profile = {"pump": {"flow_rate_ml_per_sec": 2.0}}
+        with patch("src.plant_agent.save_hardware_profile") as mock_save:
+            apply_hardware_update(
+                {"pump.flow_rate_ml_per_sec": 3.5, "light.type": "LED"}, profile
+            )
+
+        assert profile == {"pump": {"flow_rate_ml_per_sec": 3.5}, "light": {"type": "LED"}}
+        mock_save.assert_called_once_with(profile)
+
+    def test_unchanged_values_skip_save(self):
+        profile = {"pump": {"flow_rate_ml_per_sec": 2.0}}
+        with patch("src.plant_agent.save_hardware_profile") as mock_save:
+            apply_hardware_update({"pump.flow_rate_ml_per_sec": 2.0}, profile)
+
+        mock_save.assert_not_called()
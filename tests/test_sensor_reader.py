@@ -321,6 +321,22 @@ class TestReadSensors:
         assert result.temperature_c == 24.5
         assert result.co2_ppm == 450
 
+    def test_in_process_skips_subprocess(self, tmp_path):
+        """A loadable farmctl.py is run in-process, not via subprocess."""
+        farmctl = tmp_path / "farmctl.py"
+        farmctl.write_text(
+            "serial = object()\n"
+            "class SerialClient:\n"
+            "    pass\n"
+            "def execute(argv, sc=None):\n"
+            f"    return 0, {json.dumps(json.dumps(VALID_SENSOR_DICT))}, ''\n"
+        )
+        with patch("src.sensor_reader.subprocess.run") as mock_run:
+            result = read_sensors(str(farmctl))
+
+        mock_run.assert_not_called()
+        assert result.temperature_c == 24.5
+
     def test_nonzero_exit_raises(self):
         """Non-zero return code causes SensorReadError after retries."""
         mock_result = subprocess.CompletedProcess(